@@ -24,6 +24,7 @@ class StreamChannel(Enum):
     STOCK = 'stock.price.stream'
     CRYPTO = 'crypto.price.stream'
     FOREX = 'forex.price.stream'
+    ALERT = 'alert.stream'
 
 
 class ApiEndpoint:
@@ -54,3 +55,106 @@ class TimeConstants:
     ERROR_THRESHOLD: Final[int] = 5      # 에러 임계값
     CHART_DAYS: Final[int] = 30          # 차트 데이터 기간
     CHART_BUFFER_DAYS: Final[int] = 45   # 차트 데이터 버퍼 기간
+    CHART_DOWNLOAD_CONCURRENCY: Final[int] = 8  # 동시 다운로드 심볼 수
+    CHART_RETRY_ATTEMPTS: Final[int] = 2  # 실패 심볼 개별 재시도 횟수
+    MARKET_CYCLE_MIN_INTERVAL: Final[int] = 15  # 시세 수집 사이클 최소 주기
+    WORKER_START_STAGGER: Final[float] = 2.0  # 워커 시작 간격
+
+
+class SessionConstants:
+    MAX_FAILURES: Final[int] = 3           # 연속 실패 허용 횟수
+    MAX_AGE: Final[int] = 3600             # 세션 최대 수명 (1시간)
+    CLOSE_GRACE: Final[int] = 120          # 교체된 세션을 닫기 전 대기 (진행 중 요청 보호)
+
+
+class CandleConstants:
+    INTERVALS: Final[dict] = {'1m': 60, '5m': 300}  # 집계 봉 간격 (초)
+    BUFFER_SIZE: Final[int] = 390          # 심볼별 보관 봉 수 (정규장 1분봉 기준)
+    KEY_TTL: Final[int] = 86400            # Redis 보관 시간 (1일)
+    FLUSH_DELAY: Final[int] = 5            # 봉 경계 이후 저장까지 대기 (늦은 틱 반영)
+
+
+class ChartStorageConstants:
+    FORMAT: Final[str] = os.environ.get('CHART_STORAGE_FORMAT', 'legacy')  # legacy | columnar
+    COMPRESS: Final[bool] = os.environ.get('CHART_COMPRESSION', 'false').lower() == 'true'
+    METADATA_KEY: Final[str] = 'chart.metadata'
+
+
+class SupervisorConstants:
+    CHECK_INTERVAL: Final[int] = 10        # 워치독 점검 주기
+    BACKOFF_BASE: Final[int] = 5           # 재시작 대기 시작값
+    BACKOFF_MAX: Final[int] = 300          # 재시작 대기 최대값 (5분)
+    CANCEL_TIMEOUT: Final[int] = 10        # 취소 완료 대기 시간
+    HEARTBEAT_TTL: Final[int] = 120        # Redis 하트비트 키 유지 시간
+    HEARTBEAT_INTERVAL: Final[int] = 30    # 사이클 사이 대기 중 하트비트 갱신 주기
+    DEFAULT_DEADLINE: Final[int] = 300     # 사이클 기본 제한 시간
+    CYCLE_DEADLINES: Final[dict] = {
+        'publish_market_data': 300,
+        'publish_forex_data': 120,
+        'publish_market_indicators': 120,
+        'store_chart_data': 1800,
+        'flush_candles': 60,
+    }
+
+
+class CaptureConstants:
+    MODE: Final[str] = os.environ.get('UPSTREAM_MODE', 'live')  # live | record | replay
+    DIRECTORY: Final[str] = os.environ.get('UPSTREAM_CAPTURE_DIR', 'captures')
+    REPLAY_SPEED: Final[float] = float(os.environ.get('REPLAY_SPEED', '1.0'))  # 0 이면 대기 없이 재생
+
+
+class CacheConstants:
+    ENABLED: Final[bool] = os.environ.get('UPSTREAM_CACHE_ENABLED', 'true').lower() == 'true'
+    QUOTE_TTL: Final[int] = 15             # 심볼별 시세 캐시 유지 시간
+    INDICATOR_TTL: Final[int] = 30         # 지표 응답 캐시 유지 시간
+    LEASE_TTL: Final[int] = 10             # 갱신 리스 유지 시간
+    POLL_INTERVAL: Final[float] = 0.2      # 리스 대기 중 캐시 확인 주기
+
+
+class SnapshotConstants:
+    LEGACY_BLOB: Final[bool] = os.environ.get('SNAPSHOT_LEGACY_BLOB', 'true').lower() == 'true'
+    HASH_PREFIX: Final[str] = 'snapshot.hash'  # snapshot.hash.{group} (필드 = 심볼)
+    FULL_SYNC_INTERVAL: Final[int] = 300   # 변경 없는 필드까지 다시 쓰는 주기
+
+
+class PipelineConstants:
+    FETCH_QUEUE_SIZE: Final[int] = 32      # 수집 대기 심볼 수 (가득 차면 producer 대기)
+    NORMALIZE_QUEUE_SIZE: Final[int] = 64  # 정규화 대기 (심볼별 최신 값만 유지)
+    MERGE_QUEUE_SIZE: Final[int] = 64      # 병합 대기 (심볼별 최신 값만 유지)
+    PUBLISH_QUEUE_SIZE: Final[int] = 2     # Redis 발행 대기 그룹 (가득 차면 수집이 대기)
+    FETCH_CONCURRENCY: Final[int] = 2
+    NORMALIZE_CONCURRENCY: Final[int] = 1
+
+
+class ProfilerConstants:
+    ADMIN_TOKEN: Final[str] = os.environ.get('ADMIN_TOKEN', '')  # 비어 있으면 관리자 API 비활성화
+    MAX_SECONDS: Final[float] = 60.0       # CPU 프로파일 최대 시간
+    DEFAULT_INTERVAL: Final[float] = 0.01  # 샘플링 간격 (10ms)
+    TRACEMALLOC_FRAMES: Final[int] = 25    # 할당 traceback 깊이
+
+
+class IndicatorConstants:
+    # "종류:기간" 목록 (sma, ema, rsi, volatility)
+    SPECS: Final[str] = os.environ.get('CHART_INDICATORS', 'sma:5,sma:20,ema:12,rsi:14,volatility:20')
+    TRADING_DAYS: Final[int] = 252         # 연율화 기준 (주식/지수/외환)
+    CRYPTO_DAYS: Final[int] = 365          # 연율화 기준 (암호화폐)
+
+
+class AlertConstants:
+    ENABLED: Final[bool] = os.environ.get('ALERTS_ENABLED', 'true').lower() == 'true'
+    RULES_KEY: Final[str] = 'alert.rules'                 # rule_id -> AlertRule JSON
+    VERSION_KEY: Final[str] = 'alert.rules.version'       # 규칙 변경 시 INCR
+    REFRESH_INTERVAL: Final[int] = 5       # 규칙 버전 확인 주기 (초)
+
+
+class CrossRateConstants:
+    # USD 레그로 계산할 크로스 ("심볼:BASE/QUOTE" 목록, 기본 FOREX 크로스에 추가)
+    EXTRA_PAIRS: Final[str] = os.environ.get('FOREX_CROSS_PAIRS', '')
+
+
+class LoopMonitorConstants:
+    SAMPLE_INTERVAL: Final[float] = 0.25   # 지연 측정 주기 (초)
+    DEBUG: Final[bool] = os.environ.get('LOOP_DEBUG', 'false').lower() == 'true'
+    BLOCK_THRESHOLD: Final[float] = float(os.environ.get('LOOP_BLOCK_THRESHOLD', '0.1'))
+    STACK_DEPTH: Final[int] = 30           # 보고할 스택 프레임 수
+    MAX_REPORTS: Final[int] = 20           # 보관할 최근 블로킹 보고 수
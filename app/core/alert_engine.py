@@ -0,0 +1,192 @@
+import json
+import logging
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+
+from .redis_manager import RedisManager
+from ..constants.app_constants import AlertConstants
+from ..models.data_models import AlertRule
+
+logger = logging.getLogger(__name__)
+
+ALERTS_FIRED = Counter('alerts_fired_total', 'Alerts fired by the alert engine', ['op'])
+EVALUATION_SECONDS = Histogram(
+    'alert_evaluation_seconds', 'Alert evaluation time per published group',
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01))
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """"1234.56", "+1.2", "1,234" -> float (숫자가 아니면 None)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value.replace(',', ''))
+    except ValueError:
+        return None
+
+
+class AlertLadder:
+    """기준값 오름차순으로 정렬된 규칙 목록 (이전 값과 새 값 사이만 bisect)"""
+    __slots__ = ('thresholds', 'rule_ids')
+
+    def __init__(self, entries: List[Tuple[float, str]]):
+        entries.sort()
+        self.thresholds = [threshold for threshold, _ in entries]
+        self.rule_ids = [rule_id for _, rule_id in entries]
+
+    def crossed_up(self, previous: float, current: float) -> List[str]:
+        """previous < threshold <= current"""
+        if current <= previous:
+            return []
+        return self.rule_ids[bisect_right(self.thresholds, previous):
+                             bisect_right(self.thresholds, current)]
+
+    def crossed_down(self, previous: float, current: float) -> List[str]:
+        """current <= threshold < previous"""
+        if current >= previous:
+            return []
+        return self.rule_ids[bisect_left(self.thresholds, current):
+                             bisect_left(self.thresholds, previous)]
+
+
+class AlertEngine:
+    """발행되는 시세마다 규칙을 평가해 alert.stream 으로 보낼 알림을 만든다
+
+    규칙은 Redis 해시(alert.rules)에 저장하고, 버전 키가 바뀌었을 때만 다시 읽어
+    심볼/필드별 above, below 사다리와 범주형(change) 규칙 인덱스를 만든다.
+    """
+    _instance: Optional['AlertEngine'] = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.enabled = AlertConstants.ENABLED
+            self.rules: Dict[str, AlertRule] = {}
+            self.ladders: Dict[str, Dict[str, Dict[str, AlertLadder]]] = {}
+            self.change_rules: Dict[str, Dict[str, List[str]]] = {}
+            self.last_values: Dict[str, Dict[str, Any]] = {}
+            self.version: Optional[str] = None
+            self.checked_at = 0.0
+            self._initialized = True
+
+    def add_rule(self, rule: AlertRule) -> str:
+        rule_id = uuid.uuid4().hex[:12]
+        pipe = RedisManager().client.pipeline(transaction=True)
+        pipe.hset(AlertConstants.RULES_KEY, rule_id, rule.model_dump_json())
+        pipe.incr(AlertConstants.VERSION_KEY)
+        pipe.execute()
+        return rule_id
+
+    def remove_rule(self, rule_id: str) -> bool:
+        pipe = RedisManager().client.pipeline(transaction=True)
+        pipe.hdel(AlertConstants.RULES_KEY, rule_id)
+        pipe.incr(AlertConstants.VERSION_KEY)
+        removed, _ = pipe.execute()
+        return bool(removed)
+
+    def list_rules(self) -> Dict[str, dict]:
+        raw = RedisManager().client.hgetall(AlertConstants.RULES_KEY)
+        return {rule_id: json.loads(value) for rule_id, value in raw.items()}
+
+    def refresh(self, force: bool = False) -> None:
+        """규칙 버전이 바뀌었으면 인덱스 재구성"""
+        now = time.time()
+        if not force and now - self.checked_at < AlertConstants.REFRESH_INTERVAL:
+            return
+        self.checked_at = now
+
+        redis_client = RedisManager().client
+        version = redis_client.get(AlertConstants.VERSION_KEY)
+        if not force and version == self.version:
+            return
+
+        rules = {}
+        for rule_id, value in redis_client.hgetall(AlertConstants.RULES_KEY).items():
+            try:
+                rules[rule_id] = AlertRule.model_validate_json(value)
+            except ValueError as e:
+                logger.warning(f"Invalid alert rule {rule_id}: {str(e)}")
+        self.build(rules)
+        self.version = version
+        logger.info(f"Alert rules loaded ({len(rules)} rules, version {version})")
+
+    def build(self, rules: Dict[str, AlertRule]) -> None:
+        entries = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        change_rules = defaultdict(lambda: defaultdict(list))
+        for rule_id, rule in rules.items():
+            if rule.op == "change":
+                change_rules[rule.symbol][rule.field].append(rule_id)
+            elif rule.value is not None:
+                entries[rule.symbol][rule.field][rule.op].append((rule.value, rule_id))
+
+        self.rules = rules
+        self.ladders = {
+            symbol: {
+                field: {op: AlertLadder(items) for op, items in ops.items()}
+                for field, ops in fields.items()
+            }
+            for symbol, fields in entries.items()
+        }
+        self.change_rules = {symbol: dict(fields) for symbol, fields in change_rules.items()}
+
+    def evaluate(self, group: str, updates: Dict[str, Dict[str, Any]]) -> List[dict]:
+        """변경된 심볼의 새 값으로 규칙 평가 (첫 값은 기준으로만 저장)"""
+        if not self.enabled:
+            return []
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to refresh alert rules: {str(e)}")
+
+        start_time = time.perf_counter()
+        fired = []
+        for symbol, data in updates.items():
+            previous = self.last_values.get(symbol)
+            self.last_values[symbol] = data
+            if previous is None or not isinstance(data, dict):
+                continue
+
+            for field, ladders in self.ladders.get(symbol, {}).items():
+                before, after = parse_number(previous.get(field)), parse_number(data.get(field))
+                if before is None or after is None or before == after:
+                    continue
+                for op, ladder in ladders.items():
+                    crossed = (ladder.crossed_up(before, after) if op == "above"
+                               else ladder.crossed_down(before, after))
+                    fired.extend(self.alert(rule_id, group, previous.get(field), data.get(field))
+                                 for rule_id in crossed)
+
+            for field, rule_ids in self.change_rules.get(symbol, {}).items():
+                if previous.get(field) != data.get(field):
+                    fired.extend(self.alert(rule_id, group, previous.get(field), data.get(field))
+                                 for rule_id in rule_ids)
+
+        EVALUATION_SECONDS.observe(time.perf_counter() - start_time)
+        return fired
+
+    def alert(self, rule_id: str, group: str, previous: Any, value: Any) -> dict:
+        rule = self.rules[rule_id]
+        ALERTS_FIRED.labels(op=rule.op).inc()
+        return {
+            "rule_id": rule_id,
+            "group": group,
+            "symbol": rule.symbol,
+            "field": rule.field,
+            "op": rule.op,
+            "threshold": rule.value,
+            "previous": previous,
+            "value": value,
+            "fired_at": time.time()
+        }
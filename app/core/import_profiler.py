@@ -0,0 +1,27 @@
+import importlib
+import logging
+import time
+from types import ModuleType
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# 모듈별 import 소요 시간 (콜드 스타트 회귀 확인용)
+IMPORT_TIMES: Dict[str, float] = {}
+
+
+def timed_import(module_name: str) -> ModuleType:
+    """모듈을 import 하고 소요 시간을 기록"""
+    start_time = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed_time = time.perf_counter() - start_time
+
+    # 첫 import 비용만 의미가 있으므로 최초 기록만 유지
+    if module_name not in IMPORT_TIMES:
+        IMPORT_TIMES[module_name] = round(elapsed_time, 4)
+        logger.info(f"Imported {module_name} in {elapsed_time:.3f} seconds")
+    return module
+
+
+def get_import_times() -> Dict[str, float]:
+    return dict(IMPORT_TIMES)
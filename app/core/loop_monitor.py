@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from prometheus_client import Counter, Histogram
+
+from ..constants.app_constants import LoopMonitorConstants
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG = Histogram(
+    'event_loop_lag_seconds', 'Delay between a scheduled wakeup and the event loop running it',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+LOOP_BLOCKS = Counter(
+    'event_loop_blocked_total', 'Callbacks that held the event loop longer than the threshold',
+    ['task'])
+LOOP_BLOCK_SECONDS = Histogram(
+    'event_loop_block_seconds', 'Duration of blocking callbacks by task', ['task'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+
+
+def task_name(task: Optional[asyncio.Task]) -> str:
+    """워커/스테이지 태스크 이름 (태스크 밖의 콜백이면 callback)"""
+    return task.get_name() if task is not None else "callback"
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정과 (LOOP_DEBUG) 블로킹 콜백 스택 보고
+
+    - sampler: 루프 안에서 sleep 후 실제로 깨어난 시각과의 차이를 히스토그램에 기록
+    - watchdog: 별도 스레드가 sampler 의 마지막 틱을 감시하다 임계값을 넘기면
+      루프 스레드의 현재 스택과 실행 중인 태스크 이름을 기록
+    """
+    _instance: Optional['LoopMonitor'] = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.debug = LoopMonitorConstants.DEBUG
+            self.threshold = LoopMonitorConstants.BLOCK_THRESHOLD
+            self.interval = LoopMonitorConstants.SAMPLE_INTERVAL
+            if self.debug:
+                # 임계값보다 촘촘하게 틱을 남겨야 블로킹을 구분할 수 있다
+                self.interval = min(self.interval, self.threshold / 2)
+            self.loop: Optional[asyncio.AbstractEventLoop] = None
+            self.loop_thread_id: Optional[int] = None
+            self.last_tick = 0.0
+            self.last_lag = 0.0
+            self.max_lag = 0.0
+            self.pending: Optional[dict] = None  # 진행 중인 블로킹 (watchdog 이 기록)
+            self.reports: Deque[dict] = deque(maxlen=LoopMonitorConstants.MAX_REPORTS)
+            self._sampler: Optional[asyncio.Task] = None
+            self._watchdog: Optional[threading.Thread] = None
+            self._stop = threading.Event()
+            self._initialized = True
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            return
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.last_tick = time.monotonic()
+        self._stop.clear()
+        self._sampler = asyncio.create_task(self.sample(), name="loop_monitor")
+
+        if self.debug:
+            self._watchdog = threading.Thread(
+                target=self.watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+            logger.info(f"Loop block detection enabled (threshold {self.threshold}s)")
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            await asyncio.gather(self._sampler, return_exceptions=True)
+            self._sampler = None
+
+    async def sample(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - started - self.interval, 0.0)
+            self.last_tick = now
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            LOOP_LAG.observe(lag)
+
+            pending, self.pending = self.pending, None
+            if pending is not None:
+                self.finish_report(pending, lag)
+
+    def watch(self) -> None:
+        """루프 스레드 밖에서 실행: 틱이 멈추면 루프 스레드 스택을 캡처"""
+        limit = self.interval + self.threshold
+        while not self._stop.wait(self.threshold / 4):
+            tick = self.last_tick
+            if self.pending is not None or time.monotonic() - tick < limit:
+                continue
+            report = self.capture()
+            if report is not None and self.last_tick == tick:
+                self.pending = report
+                logger.warning(
+                    f"Event loop blocked > {self.threshold}s by {report['task']}\n"
+                    + "".join(report["stack"]))
+
+    def capture(self) -> Optional[dict]:
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return None
+        return {
+            "task": task_name(asyncio.current_task(self.loop)),
+            "stack": traceback.format_stack(frame, limit=LoopMonitorConstants.STACK_DEPTH),
+            "detected_at": time.time()
+        }
+
+    def finish_report(self, report: dict, lag: float) -> None:
+        """루프가 다시 돌기 시작하면 블로킹 시간을 확정해 기록"""
+        report["duration"] = round(lag, 4)
+        LOOP_BLOCKS.labels(task=report["task"]).inc()
+        LOOP_BLOCK_SECONDS.labels(task=report["task"]).observe(report["duration"])
+        self.reports.append(report)
+        logger.warning(f"Event loop resumed after {report['duration']}s (blocked by {report['task']})")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "last_lag": round(self.last_lag, 4),
+            "max_lag": round(self.max_lag, 4),
+            "blocked": self.pending is not None,
+            "debug": self.debug
+        }
+
+    def recent_blocks(self) -> List[dict]:
+        return list(self.reports)
@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Optional
+
+from ..constants.app_constants import ProfilerConstants
+
+
+def sample_stacks(seconds: float, interval: float = ProfilerConstants.DEFAULT_INTERVAL) -> Counter:
+    """모든 스레드의 스택을 주기적으로 샘플링 (folded stack -> 샘플 수)"""
+    own_thread = threading.get_ident()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    samples: Counter = Counter()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            samples[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+
+    return samples
+
+
+def to_folded(samples: Dict[str, int]) -> str:
+    """flamegraph.pl / speedscope 에서 바로 읽을 수 있는 folded 포맷"""
+    return "\n".join(f"{stack} {count}" for stack, count in sorted(samples.items())) + "\n"
+
+
+def allocation_folded(snapshot: tracemalloc.Snapshot, baseline: Optional[tracemalloc.Snapshot] = None) -> str:
+    """할당 traceback 을 바이트 단위 가중치의 folded 포맷으로 변환"""
+    if baseline is None:
+        stats = [(stat.traceback, stat.size) for stat in snapshot.statistics('traceback')]
+    else:
+        stats = [(stat.traceback, stat.size_diff)
+                 for stat in snapshot.compare_to(baseline, 'traceback') if stat.size_diff > 0]
+
+    samples: Counter = Counter()
+    for traceback, size in stats:
+        # tracemalloc traceback 은 오래된 프레임(root)부터 정렬되어 있다
+        stack = ";".join(f"{frame.filename}:{frame.lineno}" for frame in traceback)
+        samples[stack] += size
+    return to_folded(samples)
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, baseline: Optional[tracemalloc.Snapshot] = None,
+                    limit: int = 25) -> list:
+    if baseline is None:
+        stats = snapshot.statistics('lineno')[:limit]
+        return [{"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+                for stat in stats]
+    stats = snapshot.compare_to(baseline, 'lineno')[:limit]
+    return [{"location": str(stat.traceback), "size": stat.size, "size_diff": stat.size_diff,
+             "count_diff": stat.count_diff} for stat in stats]
+
+
+class MemoryProfiler:
+    """tracemalloc 기준 스냅샷 관리"""
+
+    def __init__(self):
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(ProfilerConstants.TRACEMALLOC_FRAMES)
+        self.baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        self.baseline = None
+        tracemalloc.stop()
+
+    def snapshot(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not running")
+        return tracemalloc.take_snapshot()
+
+    async def around(self, run: Callable[[], Awaitable], limit: int = 25) -> dict:
+        """run 전후 스냅샷 차이 (이미 추적 중이 아니면 끝난 뒤 추적을 멈춘다)"""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(ProfilerConstants.TRACEMALLOC_FRAMES)
+        try:
+            # 스냅샷/비교는 루프를 막지 않도록 스레드에서 실행
+            before = await asyncio.to_thread(tracemalloc.take_snapshot)
+            tracemalloc.reset_peak()
+            start_time = time.time()
+            await run()
+            elapsed_time = time.time() - start_time
+            after = await asyncio.to_thread(tracemalloc.take_snapshot)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        return {
+            "elapsed": round(elapsed_time, 3),
+            "peak_bytes": peak,
+            "top": await asyncio.to_thread(top_allocations, after, before, limit),
+            "folded": await asyncio.to_thread(allocation_folded, after, before)
+        }
@@ -0,0 +1,149 @@
+import logging
+import random
+import threading
+import time
+from typing import List, Optional
+from curl_cffi import requests
+from yfinance.data import YfData
+from yfinance.exceptions import YFRateLimitError
+
+from ..constants.app_constants import SessionConstants
+from ..constants.header_constants import USER_AGENTS, HEADERS_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+# 세션을 폐기해야 하는 업스트림 응답 코드 (인증 만료 / 레이트 리밋)
+RETIRE_STATUS_CODES = (401, 429)
+
+
+def get_random_headers() -> dict:
+    headers = random.choice(HEADERS_TEMPLATES).copy()
+    headers['User-Agent'] = random.choice(USER_AGENTS)
+    return headers
+
+
+def response_status(error: Exception) -> Optional[int]:
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+class PooledSession:
+    """keep-alive 연결과 쿠키를 재사용하는 impersonate 세션"""
+
+    def __init__(self):
+        self.session = requests.Session(impersonate="chrome")
+        self.session.headers.update(get_random_headers())
+        self.created_at = time.time()
+        self.failures = 0
+        self.successes = 0
+        self.retired = False
+        self.replaced_at: Optional[float] = None
+
+    @property
+    def expired(self) -> bool:
+        return time.time() - self.created_at >= SessionConstants.MAX_AGE
+
+    @property
+    def healthy(self) -> bool:
+        return not self.retired and not self.expired
+
+    def close(self):
+        try:
+            self.session.close()
+        except Exception as e:
+            logger.debug(f"Session close error: {str(e)}")
+
+
+class SessionPool:
+    """yfinance 가 공유하는 세션을 관리
+
+    yfinance 는 세션과 쿠키/crumb 를 프로세스 전역 YfData 하나에 보관하므로
+    활성 세션은 하나만 두고 모든 요청(스레드 포함)이 이를 함께 사용한다.
+    세션이 거부되거나 오래되면 새 세션으로 교체하고 YfData 의 crumb 를 초기화한다.
+    교체된 세션은 다른 스레드의 요청이 진행 중일 수 있어 CLOSE_GRACE 가 지난 뒤
+    다음 교체 때 닫는다.
+    네트워크 요청을 하지 않으므로 이벤트 루프에서 호출해도 된다.
+    """
+    _instance: Optional['SessionPool'] = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.current: Optional[PooledSession] = None
+            self.draining: List[PooledSession] = []  # 교체되어 닫기를 기다리는 세션
+            self.rotations = 0
+            self._lock = threading.Lock()
+            self._initialized = True
+
+    def acquire(self) -> PooledSession:
+        """활성 세션 반환 (없거나 폐기되었으면 교체)"""
+        with self._lock:
+            if self.current is None or not self.current.healthy:
+                self._rotate()
+            return self.current
+
+    def _rotate(self):
+        previous, self.current = self.current, PooledSession()
+        data = YfData(session=self.current.session)
+        with data._cookie_lock:
+            # 이전 세션에 묶인 쿠키/crumb 는 새 세션에서 다시 발급받는다
+            data._cookie = None
+            data._crumb = None
+        if previous is not None:
+            previous.replaced_at = time.time()
+            self.draining.append(previous)
+            self.rotations += 1
+        self._close_drained()
+        logger.info(f"Yahoo session installed (rotation {self.rotations})")
+
+    def _close_drained(self):
+        now = time.time()
+        keep = []
+        for pooled in self.draining:
+            if now - pooled.replaced_at >= SessionConstants.CLOSE_GRACE:
+                pooled.close()
+            else:
+                keep.append(pooled)
+        self.draining = keep
+
+    def report_success(self, pooled: Optional[PooledSession]):
+        if pooled is None:
+            return
+        pooled.failures = 0
+        pooled.successes += 1
+
+    def report_failure(self, pooled: Optional[PooledSession], error: Exception):
+        if pooled is None:
+            return
+        if isinstance(error, YFRateLimitError) or response_status(error) in RETIRE_STATUS_CODES:
+            logger.warning(f"Retiring session after upstream rejection: {str(error)}")
+            self.retire(pooled)
+            return
+
+        pooled.failures += 1
+        if pooled.failures >= SessionConstants.MAX_FAILURES:
+            logger.warning(
+                f"Retiring session after {pooled.failures} consecutive failures")
+            self.retire(pooled)
+
+    def retire(self, pooled: PooledSession):
+        # 다음 acquire() 에서 교체
+        pooled.retired = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            current = self.current
+            return {
+                "rotations": self.rotations,
+                "draining": len(self.draining),
+                "session": None if current is None else {
+                    "age": round(time.time() - current.created_at, 1),
+                    "successes": current.successes,
+                    "failures": current.failures
+                }
+            }
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from .redis_manager import RedisManager
+from ..constants.app_constants import CacheConstants, CaptureConstants
+
+logger = logging.getLogger(__name__)
+
+# 자신이 잡은 리스만 해제
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SharedCache:
+    """레플리카 간 공유하는 업스트림 응답 캐시
+
+    캐시가 비어 있으면 리스(SET NX PX)를 잡은 한 레플리카만 업스트림을 호출하고,
+    나머지는 리스가 끝날 때까지 캐시에 값이 채워지기를 기다린다.
+    """
+
+    def __init__(self):
+        self.redis_client = RedisManager().client
+        # 재생 모드에서는 재생 데이터가 그대로 흘러가도록 캐시를 쓰지 않는다
+        self.enabled = CacheConstants.ENABLED and CaptureConstants.MODE != 'replay'
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.redis_client.get(f"cache.{key}")
+        return json.loads(raw) if raw is not None else None
+
+    def try_lease(self, key: str, lease_ttl: int = CacheConstants.LEASE_TTL) -> bool:
+        return bool(self.redis_client.set(
+            f"lease.{key}", self.owner, nx=True, px=lease_ttl * 1000))
+
+    def release(self, key: str) -> None:
+        self.redis_client.eval(RELEASE_SCRIPT, 1, f"lease.{key}", self.owner)
+
+    def put(self, key: str, value: Any, ttl: int) -> None:
+        self.redis_client.set(f"cache.{key}", json.dumps(value), ex=ttl)
+        self.release(key)
+
+    async def wait_for(self, key: str, timeout: float) -> Optional[Any]:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            await asyncio.sleep(CacheConstants.POLL_INTERVAL)
+            value = self.get(key)
+            if value is not None:
+                return value
+        return None
+
+    async def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """(캐시 값, 직접 가져와야 하는지) 반환. 가져와야 하면 리스를 잡은 상태"""
+        if not self.enabled:
+            return None, True
+
+        try:
+            cached = self.get(key)
+            if cached is not None:
+                return cached, False
+
+            if not self.try_lease(key):
+                cached = await self.wait_for(key, CacheConstants.LEASE_TTL)
+                if cached is not None:
+                    return cached, False
+                # 리스를 잡은 레플리카가 갱신하지 못했으면 직접 가져온다
+                logger.warning(f"Lease for {key} expired without refresh, fetching directly")
+        except Exception as e:
+            logger.error(f"Shared cache error for {key}: {str(e)}")
+        return None, True
+
+    def store(self, key: str, value: Any, ttl: int) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.put(key, value, ttl)
+        except Exception as e:
+            logger.error(f"Error storing {key} in shared cache: {str(e)}")
+
+    def abandon(self, key: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.release(key)
+        except Exception as e:
+            logger.error(f"Error releasing lease for {key}: {str(e)}")
+
+    async def get_or_fetch(self, key: str, ttl: int, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        cached, should_fetch = await self.lookup(key)
+        if not should_fetch:
+            return cached
+
+        try:
+            value = await fetch()
+        except Exception:
+            self.abandon(key)
+            raise
+
+        self.store(key, value, ttl)
+        return value
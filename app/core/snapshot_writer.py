@@ -0,0 +1,74 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .redis_manager import RedisManager
+from .alert_engine import AlertEngine
+from ..constants.app_constants import SnapshotConstants, StreamChannel
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotWriter:
+    """채널 발행과 스냅샷 저장을 하나의 MULTI 로 처리
+
+    snapshot.hash.{group} 해시에는 심볼별 필드를 변경분만 HSET 하고 (전체 동기화 때는
+    해시를 다시 만들어 더 이상 발행하지 않는 심볼을 지운다),
+    SNAPSHOT_LEGACY_BLOB 이 켜져 있으면 기존 snapshot.{group} JSON 도 함께 갱신한다.
+    바뀐 심볼은 알림 규칙으로 평가해 발생한 알림을 alert.stream 으로 함께 발행한다.
+    """
+    _instance: Optional['SnapshotWriter'] = None
+    _fields: Optional[Dict[str, Dict[str, str]]] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._fields is None:
+            self._fields = {}  # group -> symbol -> 마지막으로 쓴 JSON
+            self._synced_at: Dict[str, float] = {}
+            self._lock = threading.Lock()  # 파이프라인 발행 스테이지는 스레드에서 호출
+            self.legacy_blob = SnapshotConstants.LEGACY_BLOB
+            self.alerts = AlertEngine()
+
+    @staticmethod
+    def hash_key(group: str) -> str:
+        return f"{SnapshotConstants.HASH_PREFIX}.{group}"
+
+    def publish(self, channel: str, group: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._publish(channel, group, result)
+
+    def _publish(self, channel: str, group: str, result: Dict[str, Any]) -> None:
+        payload = json.dumps(result)
+        encoded = {symbol: json.dumps(data) for symbol, data in result.items()}
+
+        # 주기적으로 전체 필드를 다시 써서 Redis 쪽 유실에 대비
+        full_sync = time.time() - self._synced_at.get(group, 0) >= SnapshotConstants.FULL_SYNC_INTERVAL
+        previous = self._fields.setdefault(group, {})
+        diff = {symbol: value for symbol, value in encoded.items() if previous.get(symbol) != value}
+        changed = encoded if full_sync else diff
+        fired = self.alerts.evaluate(group, {symbol: result[symbol] for symbol in diff})
+
+        pipe = RedisManager().client.pipeline(transaction=True)
+        pipe.publish(channel, payload)
+        if full_sync:
+            # 이전 프로세스가 쓴 필드까지 정리되도록 해시를 통째로 교체 (MULTI 안이라 원자적)
+            pipe.delete(self.hash_key(group))
+        if changed:
+            pipe.hset(self.hash_key(group), mapping=changed)
+        if self.legacy_blob:
+            pipe.set(f"snapshot.{group}", payload)
+        if fired:
+            pipe.publish(StreamChannel.ALERT.value, json.dumps(fired))
+        pipe.execute()
+
+        if full_sync:
+            self._fields[group] = dict(encoded)
+            self._synced_at[group] = time.time()
+        else:
+            previous.update(changed)
@@ -0,0 +1,134 @@
+import asyncio
+import gzip
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..constants.app_constants import CaptureConstants
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayCursor:
+    def __init__(self, records: List[Tuple[float, Any]]):
+        self.records = records
+        self.position = 0
+        self.started_at: Optional[float] = None  # 재생 시작 시각 (wall clock)
+
+    def next(self, speed: float) -> Tuple[Any, float]:
+        """다음 응답과 기록 시점에 맞추기 위한 대기 시간"""
+        if self.position >= len(self.records):
+            self.position = 0  # 끝까지 재생하면 처음부터 반복
+            self.started_at = None
+
+        recorded_at, payload = self.records[self.position]
+        self.position += 1
+
+        now = time.time()
+        if self.started_at is None or speed <= 0:
+            self.started_at = now
+            return payload, 0.0
+
+        elapsed = (recorded_at - self.records[0][0]) / speed
+        return payload, max(0.0, self.started_at + elapsed - now)
+
+
+class UpstreamCapture:
+    """업스트림 원본 응답 기록(record) / 재생(replay)
+
+    기록 파일은 소스별 gzip 압축 pickle 스트림 ({directory}/{source}.pkl.gz)이며,
+    각 레코드는 (timestamp, key, payload) 이다. DataFrame 을 그대로 보존하기 위해
+    pickle 을 사용하므로 직접 기록한 신뢰할 수 있는 파일만 재생해야 한다.
+    """
+    _instance: Optional['UpstreamCapture'] = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self.mode = CaptureConstants.MODE
+        self.directory = CaptureConstants.DIRECTORY
+        self.speed = CaptureConstants.REPLAY_SPEED
+        self._lock = threading.Lock()
+        self._writers: Dict[str, gzip.GzipFile] = {}
+        self._cursors: Dict[str, Dict[str, ReplayCursor]] = {}
+
+        if self.mode != 'live':
+            logger.info(
+                f"Upstream capture mode: {self.mode} ({self.directory}, speed={self.speed})")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def path(self, source: str) -> str:
+        return os.path.join(self.directory, f"{source}.pkl.gz")
+
+    def record(self, source: str, key: str, payload: Any) -> None:
+        if not self.recording:
+            return
+        try:
+            with self._lock:
+                writer = self._writers.get(source)
+                if writer is None:
+                    os.makedirs(self.directory, exist_ok=True)
+                    writer = self._writers[source] = gzip.open(self.path(source), 'ab')
+                pickle.dump((time.time(), key, payload), writer)
+                writer.flush()
+        except Exception as e:
+            logger.error(f"Error recording {source}/{key}: {str(e)}")
+
+    def _load(self, source: str) -> Dict[str, ReplayCursor]:
+        records: Dict[str, List[Tuple[float, Any]]] = {}
+        with gzip.open(self.path(source), 'rb') as reader:
+            while True:
+                try:
+                    recorded_at, key, payload = pickle.load(reader)
+                except EOFError:
+                    break
+                records.setdefault(key, []).append((recorded_at, payload))
+
+        logger.info(
+            f"Loaded {sum(len(r) for r in records.values())} {source} records for replay")
+        return {key: ReplayCursor(items) for key, items in records.items()}
+
+    def next_replay(self, source: str, key: str) -> Tuple[Any, float]:
+        with self._lock:
+            if source not in self._cursors:
+                self._cursors[source] = self._load(source)
+            cursor = self._cursors[source].get(key)
+            if cursor is None:
+                raise Exception(f"No recorded {source} response for {key}")
+            return cursor.next(self.speed)
+
+    async def replay(self, source: str, key: str) -> Any:
+        payload, delay = self.next_replay(source, key)
+        if delay:
+            await asyncio.sleep(delay)
+        return payload
+
+    def replay_sync(self, source: str, key: str) -> Any:
+        """스레드에서 실행되는 호출용 (차트 다운로드)"""
+        payload, delay = self.next_replay(source, key)
+        if delay:
+            time.sleep(delay)
+        return payload
+
+    def close(self):
+        with self._lock:
+            for writer in self._writers.values():
+                writer.close()
+            self._writers.clear()
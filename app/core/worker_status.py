@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from ..constants.app_constants import SupervisorConstants
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerState:
+    def __init__(self, name: str):
+        self.name = name
+        self.cycles = 0
+        self.errors = 0
+        self.cycle_started_at: Optional[float] = None
+        self.last_heartbeat: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.cycles > 0
+
+    def to_dict(self) -> dict:
+        return {
+            "ready": self.ready,
+            "cycles": self.cycles,
+            "errors": self.errors,
+            "in_cycle": self.cycle_started_at is not None,
+            "last_heartbeat": self.last_heartbeat,
+            "last_success_at": self.last_success_at,
+            "last_duration": self.last_duration,
+            "last_error": self.last_error
+        }
+
+
+class WorkerStatus:
+    """워커별 사이클 진행 상태 (readiness 판단용)"""
+    _instance: Optional['WorkerStatus'] = None
+    _workers: Optional[Dict[str, WorkerState]] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._workers is None:
+            self._workers = {}
+
+    def register(self, name: str) -> WorkerState:
+        if name not in self._workers:
+            self._workers[name] = WorkerState(name)
+        return self._workers[name]
+
+    def get(self, name: str) -> Optional[WorkerState]:
+        return self._workers.get(name)
+
+    @contextmanager
+    def cycle(self, name: str):
+        """한 사이클의 시작/종료를 기록"""
+        state = self.register(name)
+        state.cycle_started_at = state.last_heartbeat = time.time()
+        try:
+            yield state
+        except BaseException as e:
+            state.errors += 1
+            state.last_error = str(e)
+            raise
+        else:
+            state.cycles += 1
+            state.last_success_at = time.time()
+            state.last_duration = state.last_success_at - state.cycle_started_at
+            if state.cycles == 1:
+                logger.info(
+                    f"{name} completed first cycle in {state.last_duration:.2f} seconds")
+        finally:
+            state.cycle_started_at = None
+            state.last_heartbeat = time.time()
+
+    def heartbeat(self, name: str):
+        self.register(name).last_heartbeat = time.time()
+
+    async def idle(self, name: str, seconds: float):
+        """사이클 사이 대기 (긴 대기 중에도 하트비트를 주기적으로 갱신)"""
+        deadline = time.time() + seconds
+        while True:
+            self.heartbeat(name)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, SupervisorConstants.HEARTBEAT_INTERVAL))
+
+    def all_ready(self) -> bool:
+        return bool(self._workers) and all(
+            state.ready for state in self._workers.values())
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: state.to_dict() for name, state in self._workers.items()}
@@ -1,10 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+from typing import Optional
 import asyncio
+import hmac
 import logging
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
-from .workers.market_publisher import publish_market_data, publish_forex_data
-from .workers.chart_worker import store_chart_data
-from .workers.market_indicators_worker import publish_market_indicators
+from .core.redis_manager import RedisManager
+from .core.worker_status import WorkerStatus
+from .core.import_profiler import timed_import, get_import_times
+from .core.profiler import MemoryProfiler, sample_stacks, to_folded, allocation_folded, top_allocations
+from .core.alert_engine import AlertEngine
+from .core.loop_monitor import LoopMonitor
+from .core.upstream_capture import UpstreamCapture
+from .models.data_models import AlertRule
+from .workers.supervisor import WorkerSupervisor
+from .constants.app_constants import TimeConstants, ProfilerConstants
 from datetime import datetime
 
 # 로깅 설정
@@ -53,13 +63,58 @@ instrumentator.add(
 instrumentator.instrument(app).expose(app)
 
 
+# 무거운 의존성 (워커 import 전에 개별 측정)
+HEAVY_MODULES = ("pytz", "curl_cffi", "pandas", "yfinance")
+
+# (워커 함수명, 모듈) - 시작 순서대로
+WORKERS = (
+    ("publish_market_data", "app.workers.market_publisher"),
+    ("publish_forex_data", "app.workers.market_publisher"),
+    ("flush_candles", "app.workers.market_publisher"),
+    ("publish_market_indicators", "app.workers.market_indicators_worker"),
+    ("store_chart_data", "app.workers.chart_worker"),
+)
+
+worker_status = WorkerStatus()
+supervisor = WorkerSupervisor()
+loop_monitor = LoopMonitor()
+startup_tasks = []
+launch_error: Optional[str] = None
+
+
+async def launch_workers():
+    """무거운 import 를 스레드에서 처리한 뒤 워커를 순차적으로 시작"""
+    global launch_error
+    try:
+        for module_name in HEAVY_MODULES:
+            await asyncio.to_thread(timed_import, module_name)
+
+        for name, module_name in WORKERS:
+            module = await asyncio.to_thread(timed_import, module_name)
+            supervisor.add(name, getattr(module, name))
+
+        await supervisor.start(stagger=TimeConstants.WORKER_START_STAGGER)
+    except Exception as e:
+        # 백그라운드 태스크라 여기서 기록하지 않으면 /ready 가 이유 없이 503 으로 남는다
+        launch_error = f"{type(e).__name__}: {str(e)}"
+        logger.exception("Failed to launch workers")
+
+
 @app.on_event("startup")
 async def startup_event():
-    # 백그라운드 태스크 시작
-    asyncio.create_task(publish_market_data())
-    asyncio.create_task(publish_forex_data())
-    asyncio.create_task(store_chart_data())
-    asyncio.create_task(publish_market_indicators())
+    for name, _ in WORKERS:
+        worker_status.register(name)
+    loop_monitor.start()
+    # /ping 이 바로 응답하도록 워커 로딩은 백그라운드에서 진행
+    startup_tasks.append(asyncio.create_task(launch_workers(), name="launch_workers"))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await supervisor.stop()
+    await loop_monitor.stop()
+    # 기록 중인 캡처 파일의 gzip 스트림을 마무리
+    UpstreamCapture().close()
 
 
 @app.get("/ping")
@@ -67,9 +122,122 @@ async def jenkins_health_check():
     return {"status": "pong"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    redis_ok = bool(await asyncio.to_thread(RedisManager().check_connection))
+    ready = redis_ok and worker_status.all_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "failed" if launch_error else "starting",
+            "launch_error": launch_error,
+            "redis": redis_ok,
+            "workers": worker_status.snapshot(),
+            "import_times": get_import_times()
+        }
+    )
+
+
 @app.get("/health")
 async def health_check():
+    # 워커가 이미 불러온 모듈이면 캐시된 모듈을 바로 돌려받는다
+    session_pool = await asyncio.to_thread(timed_import, "app.core.session_pool")
     return {
-        "status": "ok",
-        "timestamp": datetime.now().isoformat()
+        "status": "ok" if supervisor.healthy else "degraded",
+        "timestamp": datetime.now().isoformat(),
+        "workers": supervisor.status(),
+        "event_loop": loop_monitor.stats(),
+        "yahoo_session": session_pool.SessionPool().stats()
     }
+
+
+# 관리자 프로파일링 API
+memory_profiler = MemoryProfiler()
+profile_lock = asyncio.Lock()
+
+
+async def verify_admin_token(x_admin_token: Optional[str] = Header(default=None)):
+    if not ProfilerConstants.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # 응답 시간으로 토큰을 추측하지 못하도록 상수 시간 비교
+    if not hmac.compare_digest(x_admin_token or "", ProfilerConstants.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@app.get("/admin/profile/cpu", dependencies=[Depends(verify_admin_token)],
+         response_class=PlainTextResponse)
+async def profile_cpu(seconds: float = 10.0, interval: float = ProfilerConstants.DEFAULT_INTERVAL):
+    """샘플링 CPU 프로파일 (folded stack)"""
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="Profile already running")
+    seconds = min(max(seconds, 0.1), ProfilerConstants.MAX_SECONDS)
+    interval = max(interval, 0.001)
+    async with profile_lock:
+        samples = await asyncio.to_thread(sample_stacks, seconds, interval)
+    return to_folded(samples)
+
+
+@app.post("/admin/profile/memory/start", dependencies=[Depends(verify_admin_token)])
+async def profile_memory_start():
+    await asyncio.to_thread(memory_profiler.start)
+    return {"status": "tracing"}
+
+
+@app.get("/admin/profile/memory/snapshot", dependencies=[Depends(verify_admin_token)])
+async def profile_memory_snapshot(limit: int = 25, format: str = "json"):
+    """기준 스냅샷 대비 할당 차이 (format=folded 이면 flamegraph 용 텍스트)
+
+    스냅샷과 비교는 힙 크기에 비례해 오래 걸리므로 스레드에서 실행한다.
+    """
+    try:
+        snapshot = await asyncio.to_thread(memory_profiler.snapshot)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    baseline = memory_profiler.baseline
+    if format == "folded":
+        return PlainTextResponse(await asyncio.to_thread(allocation_folded, snapshot, baseline))
+    return {"top": await asyncio.to_thread(top_allocations, snapshot, baseline, limit)}
+
+
+@app.post("/admin/profile/memory/stop", dependencies=[Depends(verify_admin_token)])
+async def profile_memory_stop():
+    memory_profiler.stop()
+    return {"status": "stopped"}
+
+
+@app.post("/admin/profile/chart", dependencies=[Depends(verify_admin_token)])
+async def profile_chart_run(limit: int = 25):
+    """차트 수집 1회 실행 전후의 메모리 할당 차이"""
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="Profile already running")
+    chart_worker = await asyncio.to_thread(timed_import, "app.workers.chart_worker")
+    async with profile_lock:
+        return await memory_profiler.around(chart_worker.collect_and_store_data, limit)
+
+
+@app.get("/admin/loop/blocks", dependencies=[Depends(verify_admin_token)])
+async def loop_blocks():
+    """LOOP_DEBUG 모드에서 감지한 최근 블로킹 콜백 (태스크 이름 + 스택)"""
+    return {"stats": loop_monitor.stats(), "blocks": loop_monitor.recent_blocks()}
+
+
+# 알림 규칙 관리 API
+@app.get("/admin/alerts/rules", dependencies=[Depends(verify_admin_token)])
+async def list_alert_rules():
+    return await asyncio.to_thread(AlertEngine().list_rules)
+
+
+@app.post("/admin/alerts/rules", dependencies=[Depends(verify_admin_token)])
+async def add_alert_rule(rule: AlertRule):
+    if rule.op != "change" and rule.value is None:
+        raise HTTPException(status_code=422, detail="value is required for above/below rules")
+    rule_id = await asyncio.to_thread(AlertEngine().add_rule, rule)
+    return {"id": rule_id}
+
+
+@app.delete("/admin/alerts/rules/{rule_id}", dependencies=[Depends(verify_admin_token)])
+async def remove_alert_rule(rule_id: str):
+    if not await asyncio.to_thread(AlertEngine().remove_rule, rule_id):
+        raise HTTPException(status_code=404, detail="Rule not found")
+    return {"status": "removed"}
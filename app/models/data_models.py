@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Dict, List, Literal, Optional
 from datetime import datetime
 
 
@@ -48,3 +48,23 @@ class StoredChartData(BaseModel):
     stored_at: str
     chart_data: Dict[str, Dict[str, str]]
     metadata: ChartMetadata
+
+
+class ColumnarChartData(BaseModel):
+    type: str
+    symbol: str
+    stored_at: str
+    format: str = "columnar"
+    start: str                          # 첫 거래일 (YYYY-MM-DD)
+    offsets: Optional[List[int]] = None  # start 로부터의 일수
+    close: Optional[List[float]] = None
+    count: Optional[int] = None          # 압축 시 데이터 개수
+    encoding: Optional[str] = None       # 압축 포맷 (delta-varint)
+    packed: Optional[str] = None         # 압축 시 base64(varint(offsets 차분) + varint(센트 종가 차분))
+
+
+class AlertRule(BaseModel):
+    symbol: str
+    field: str                                   # current_price, change_percent, rating 등
+    op: Literal["above", "below", "change"]      # change 는 값이 바뀔 때마다 (범주형)
+    value: Optional[float] = None                # above/below 기준값
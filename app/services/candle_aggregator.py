@@ -0,0 +1,159 @@
+import json
+import logging
+import threading
+import time
+from array import array
+from typing import Dict, Optional
+
+from ..core.redis_manager import RedisManager
+from ..constants.app_constants import CandleConstants
+
+logger = logging.getLogger(__name__)
+
+
+class CandleRing:
+    """고정 크기 OHLC 링 버퍼 (array 기반)"""
+
+    def __init__(self, capacity: int, seconds: int):
+        self.capacity = capacity
+        self.seconds = seconds
+        self.starts = array('q', [0]) * capacity
+        self.opens = array('d', [0.0]) * capacity
+        self.highs = array('d', [0.0]) * capacity
+        self.lows = array('d', [0.0]) * capacity
+        self.closes = array('d', [0.0]) * capacity
+        self.head = -1  # 가장 최근 봉 위치
+        self.size = 0
+        self.dirty_start: Optional[int] = None  # 마지막 저장 이후 바뀐 가장 오래된 봉
+
+    def update(self, timestamp: int, price: float) -> None:
+        bucket = timestamp - timestamp % self.seconds
+        head = self.head
+        if self.size:
+            if bucket == self.starts[head]:
+                if (price == self.closes[head]
+                        and self.lows[head] <= price <= self.highs[head]):
+                    return
+                if price > self.highs[head]:
+                    self.highs[head] = price
+                if price < self.lows[head]:
+                    self.lows[head] = price
+                self.closes[head] = price
+                self._mark(bucket)
+                return
+            if bucket < self.starts[head]:
+                return  # 늦게 도착한 틱은 무시
+
+        head = (head + 1) % self.capacity
+        self.starts[head] = bucket
+        self.opens[head] = self.highs[head] = self.lows[head] = self.closes[head] = price
+        self.head = head
+        self.size = min(self.size + 1, self.capacity)
+        self._mark(bucket)
+
+    def _mark(self, bucket: int) -> None:
+        if self.dirty_start is None:
+            self.dirty_start = bucket
+
+    def due(self, now: int) -> bool:
+        """바뀐 봉 중 마감된 봉이 있어 저장이 필요한지"""
+        return self.dirty_start is not None and self.dirty_start + self.seconds <= now
+
+    def mark_flushed(self, now: int) -> None:
+        # 아직 열린 마지막 봉은 마감될 때 다시 저장
+        head_start = self.starts[self.head]
+        self.dirty_start = head_start if head_start + self.seconds > now else None
+
+    def to_dict(self, until: int) -> Dict[str, list]:
+        """until 시각까지 마감된 봉을 오래된 것부터 컬럼 형태로 반환"""
+        first = (self.head - self.size + 1) % self.capacity
+        indexes = [(first + i) % self.capacity for i in range(self.size)]
+        indexes = [i for i in indexes if self.starts[i] + self.seconds <= until]
+        return {
+            "t": [self.starts[i] for i in indexes],
+            "o": [self.opens[i] for i in indexes],
+            "h": [self.highs[i] for i in indexes],
+            "l": [self.lows[i] for i in indexes],
+            "c": [self.closes[i] for i in indexes]
+        }
+
+
+class CandleAggregator:
+    """발행되는 시세 틱으로 인트라데이 봉을 만들고 마감된 봉을 Redis 에 저장
+
+    틱 시각은 시세의 regularMarketTime 을 사용하므로 가격이 멈춘 시간대(장외,
+    캐시 적중)에는 새 봉이 생기지 않는다. 저장은 flush_due 를 봉 경계마다
+    호출하는 타이머(flush_candles 워커)가 담당한다.
+    """
+    _instance: Optional['CandleAggregator'] = None
+    _rings: Optional[Dict[str, Dict[str, CandleRing]]] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._rings is None:
+            self._rings = {}
+            self._last_times: Dict[str, int] = {}
+            self._lock = threading.Lock()  # flush_due 는 스레드에서 호출
+            self.redis_client = RedisManager().client
+
+    def add_tick(self, symbol: str, price, timestamp: Optional[float]) -> None:
+        """시세 틱 반영 (시세 시각이 없거나 이전 틱보다 오래되면 무시)"""
+        if timestamp is None:
+            return
+        try:
+            price = float(price)
+        except (TypeError, ValueError):
+            return
+        if price <= 0:
+            return
+
+        market_time = int(timestamp)
+        with self._lock:
+            if market_time < self._last_times.get(symbol, 0):
+                return
+            self._last_times[symbol] = market_time
+
+            rings = self._rings.get(symbol)
+            if rings is None:
+                rings = self._rings[symbol] = {
+                    label: CandleRing(CandleConstants.BUFFER_SIZE, seconds)
+                    for label, seconds in CandleConstants.INTERVALS.items()
+                }
+            for ring in rings.values():
+                ring.update(market_time, price)
+
+    def flush_due(self, now: Optional[float] = None) -> int:
+        """마감된 봉이 바뀐 링만 저장하고 저장한 키 수를 반환"""
+        now = int(now if now is not None else time.time())
+        payloads, flushed = {}, []
+        with self._lock:
+            for symbol, rings in self._rings.items():
+                for label, ring in rings.items():
+                    if not ring.due(now):
+                        continue
+                    payloads[f"intraday.{symbol}.{label}"] = json.dumps({
+                        "symbol": symbol,
+                        "interval": label,
+                        **ring.to_dict(until=now)
+                    })
+                    flushed.append(ring)
+
+        if not payloads:
+            return 0
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, payload in payloads.items():
+                pipe.set(key, payload, ex=CandleConstants.KEY_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Error flushing candles: {str(e)}")
+            return 0  # 다음 타이머에서 다시 저장
+
+        with self._lock:
+            for ring in flushed:
+                ring.mark_flushed(now)
+        return len(payloads)
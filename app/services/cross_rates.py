@@ -0,0 +1,94 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..constants.app_constants import CrossRateConstants
+from ..models.stock_models import ForexSymbol
+from ..utils.formatters import format_number
+
+USD = 'USD'
+
+# 발행 심볼 -> (BASE, QUOTE), 환율 = QUOTE 통화 기준 BASE 1 단위 가격
+CROSS_PAIRS: Dict[str, Tuple[str, str]] = {
+    ForexSymbol.USDKRW.value: (USD, 'KRW'),
+    ForexSymbol.EURKRW.value: ('EUR', 'KRW'),
+    ForexSymbol.CNYKRW.value: ('CNY', 'KRW'),
+    ForexSymbol.JPYKRW.value: ('JPY', 'KRW'),
+}
+
+
+def leg_symbol(currency: str) -> str:
+    """USD/{currency} 야후 심볼 (예: JPY -> JPY=X)"""
+    return f"{currency}=X"
+
+
+def parse_pairs(raw: str) -> Dict[str, Tuple[str, str]]:
+    """"GBPKRW=X:GBP/KRW,EURJPY=X:EUR/JPY" -> {"GBPKRW=X": ("GBP", "KRW"), ...}"""
+    pairs = {}
+    for item in raw.split(','):
+        symbol, _, pair = item.strip().partition(':')
+        base, _, quote = pair.partition('/')
+        if symbol and len(base) == 3 and len(quote) == 3:
+            pairs[symbol] = (base.upper(), quote.upper())
+    return pairs
+
+
+class CrossRateEngine:
+    """통화별 USD 레그만 받아 요청된 크로스 환율과 변동을 계산
+
+    레그 수는 통화 수에 비례하므로 크로스를 늘려도 업스트림 요청은
+    새 통화가 추가될 때만 늘어난다.
+    """
+
+    def __init__(self, pairs: Optional[Dict[str, Tuple[str, str]]] = None):
+        self.pairs = dict(CROSS_PAIRS)
+        self.pairs.update(pairs if pairs is not None else parse_pairs(CrossRateConstants.EXTRA_PAIRS))
+
+    @property
+    def legs(self) -> Dict[str, str]:
+        """필요한 통화 -> USD 레그 심볼"""
+        currencies = sorted({currency for pair in self.pairs.values() for currency in pair} - {USD})
+        return {currency: leg_symbol(currency) for currency in currencies}
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.pairs)
+
+    @staticmethod
+    def leg_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        price = float(info['regularMarketPrice'])
+        previous_close = info.get('regularMarketPreviousClose')
+        if not previous_close:
+            previous_close = price - float(info.get('regularMarketChange') or 0)
+        return {
+            "price": price,
+            "previous_close": float(previous_close),
+            "market_time": info.get('regularMarketTime')
+        }
+
+    def market_time(self, legs: Dict[str, Dict[str, Any]], symbol: str) -> Optional[int]:
+        """크로스 환율의 시세 시각 = 구성 레그 중 가장 최근 시각 (하나라도 없으면 None)"""
+        times = [legs[currency].get("market_time")
+                 for currency in self.pairs[symbol] if currency != USD and currency in legs]
+        if not times or None in times:
+            return None
+        return max(times)
+
+    @staticmethod
+    def usd_rate(legs: Dict[str, Dict[str, Any]], currency: str, field: str) -> float:
+        return 1.0 if currency == USD else legs[currency][field]
+
+    def compute(self, legs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+        """BASE/QUOTE = (USD/QUOTE) / (USD/BASE), 레그가 빠진 크로스는 제외"""
+        result = {}
+        for symbol, (base, quote) in self.pairs.items():
+            if any(currency != USD and currency not in legs for currency in (base, quote)):
+                continue
+            rate = self.usd_rate(legs, quote, "price") / self.usd_rate(legs, base, "price")
+            previous = (self.usd_rate(legs, quote, "previous_close")
+                        / self.usd_rate(legs, base, "previous_close"))
+            change = rate - previous
+            result[symbol] = {
+                "rate": format_number(rate),
+                "change": format_number(change),
+                "change_percent": format_number(change / previous * 100 if previous else 0)
+            }
+        return result
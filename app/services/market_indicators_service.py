@@ -1,11 +1,12 @@
 import aiohttp
-import json
 import logging
 import time
 from typing import Dict, Any
 from ..utils.formatters import format_number, format_market_cap
-from ..core.redis_manager import RedisManager
-from ..constants.app_constants import api_endpoints, StreamChannel
+from ..core.upstream_capture import UpstreamCapture
+from ..core.shared_cache import SharedCache
+from ..core.snapshot_writer import SnapshotWriter
+from ..constants.app_constants import api_endpoints, StreamChannel, CacheConstants
 from ..models.stock_models import IndexSymbol, CryptoSymbol, IndicatorType
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,10 @@ logger = logging.getLogger(__name__)
 
 class MarketIndicatorsService:
     def __init__(self):
-        self.redis_client = RedisManager().client
         self._total3_proportion = None
+        self.capture = UpstreamCapture()
+        self.cache = SharedCache()
+        self.snapshot_writer = SnapshotWriter()
 
     @property
     def fear_greed_url(self) -> str:
@@ -36,6 +39,22 @@ class MarketIndicatorsService:
     def total3_proportion(self, value):
         self._total3_proportion = value
 
+    async def fetch_json(self, source: str, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """업스트림 JSON 요청 (record/replay 모드, 레플리카 간 공유 캐시 지원)"""
+        if self.capture.replaying:
+            return await self.capture.replay('indicator', source)
+
+        async def fetch():
+            async with aiohttp.ClientSession() as session:
+                async with session.request(method, url, ssl=False, **kwargs) as response:
+                    data = await response.json()
+
+            self.capture.record('indicator', source, data)
+            return data
+
+        return await self.cache.get_or_fetch(
+            f"indicator.{source}", CacheConstants.INDICATOR_TTL, fetch)
+
     async def fetch_fear_greed_index(self) -> Dict[str, Any]:
         try:
             headers = {
@@ -46,16 +65,15 @@ class MarketIndicatorsService:
                 'Referer': 'https://www.cnn.com/'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.fear_greed_url, headers=headers, ssl=False) as response:
-                    data = await response.json()
-                    fear_greed_data = data.get('fear_and_greed', {})
-                    return {
-                        IndexSymbol.FEAR_GREED.value: {
-                            "score": format_number(fear_greed_data.get('score', 0)),
-                            "rating": fear_greed_data.get('rating', 'Unknown').title()
-                        }
-                    }
+            data = await self.fetch_json(
+                IndicatorType.FEAR_GREED.value, 'GET', self.fear_greed_url, headers=headers)
+            fear_greed_data = data.get('fear_and_greed', {})
+            return {
+                IndexSymbol.FEAR_GREED.value: {
+                    "score": format_number(fear_greed_data.get('score', 0)),
+                    "rating": fear_greed_data.get('rating', 'Unknown').title()
+                }
+            }
         except Exception as e:
             logger.error(f"Error fetching Fear & Greed Index: {str(e)}")
             raise
@@ -68,18 +86,17 @@ class MarketIndicatorsService:
                 'Accept-Language': 'en-US,en;q=0.9'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.btc_dominance_url, headers=headers, ssl=False) as response:
-                    data = await response.json()
-                    dominance_data = data.get('data', {}).get('dominance', [])
-                    btc_dominance = dominance_data[0].get('mcProportion', 0)
-                    self.total3_proportion = dominance_data[2].get(
-                        'mcProportion', 0)  # save total3 proportion
-                    return {
-                        CryptoSymbol.BTC_DOMINANCE.value: {
-                            "value": format_number(btc_dominance)
-                        }
-                    }
+            data = await self.fetch_json(
+                IndicatorType.BTC_DOMINANCE.value, 'GET', self.btc_dominance_url, headers=headers)
+            dominance_data = data.get('data', {}).get('dominance', [])
+            btc_dominance = dominance_data[0].get('mcProportion', 0)
+            self.total3_proportion = dominance_data[2].get(
+                'mcProportion', 0)  # save total3 proportion
+            return {
+                CryptoSymbol.BTC_DOMINANCE.value: {
+                    "value": format_number(btc_dominance)
+                }
+            }
         except Exception as e:
             logger.error(f"Error fetching BTC Dominance: {str(e)}")
             raise
@@ -100,26 +117,25 @@ class MarketIndicatorsService:
                 "columns": ["close", "change_abs", "change"]
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.total3_url, headers=headers, json=payload, ssl=False) as response:
-                    data = await response.json()
-                    if data.get('data'):
-                        market_data = data['data'][0]['d']
-                        change_percent = market_data[2]
-                        change_value = format_market_cap(abs(market_data[1]))
-
-                        if change_percent < 0:
-                            change_value = f"-{change_value}"
-
-                        return {
-                            "TOTAL3": {
-                                "value": format_number(self.total3_proportion or 0),
-                                "market_cap": format_market_cap(market_data[0]),
-                                "change": change_value,
-                                "change_percent": format_number(change_percent)
-                            }
-                        }
-                    return {}
+            data = await self.fetch_json(
+                IndicatorType.TOTAL3.value, 'POST', self.total3_url, headers=headers, json=payload)
+            if data.get('data'):
+                market_data = data['data'][0]['d']
+                change_percent = market_data[2]
+                change_value = format_market_cap(abs(market_data[1]))
+
+                if change_percent < 0:
+                    change_value = f"-{change_value}"
+
+                return {
+                    "TOTAL3": {
+                        "value": format_number(self.total3_proportion or 0),
+                        "market_cap": format_market_cap(market_data[0]),
+                        "change": change_value,
+                        "change_percent": format_number(change_percent)
+                    }
+                }
+            return {}
         except Exception as e:
             logger.error(f"Error fetching Total3: {str(e)}")
             raise
@@ -130,13 +146,10 @@ class MarketIndicatorsService:
             logger.info("Starting Fear & Greed Index collection...")
 
             data = await self.fetch_fear_greed_index()
-            self.redis_client.publish(
+            self.snapshot_writer.publish(
                 StreamChannel.INDEX.value,
-                json.dumps(data)
-            )
-            self.redis_client.set(
-                f"snapshot.{IndicatorType.FEAR_GREED.value}",
-                json.dumps(data)
+                IndicatorType.FEAR_GREED.value,
+                data
             )
 
             elapsed_time = time.time() - start_time
@@ -152,13 +165,10 @@ class MarketIndicatorsService:
             logger.info("Starting BTC Dominance collection...")
 
             data = await self.fetch_btc_dominance()
-            self.redis_client.publish(
+            self.snapshot_writer.publish(
                 StreamChannel.CRYPTO.value,
-                json.dumps(data)
-            )
-            self.redis_client.set(
-                f"snapshot.{IndicatorType.BTC_DOMINANCE.value}",
-                json.dumps(data)
+                IndicatorType.BTC_DOMINANCE.value,
+                data
             )
 
             elapsed_time = time.time() - start_time
@@ -174,13 +184,10 @@ class MarketIndicatorsService:
             logger.info("Starting Total3 collection...")
 
             data = await self.fetch_total3()
-            self.redis_client.publish(
+            self.snapshot_writer.publish(
                 StreamChannel.CRYPTO.value,
-                json.dumps(data)
-            )
-            self.redis_client.set(
-                f"snapshot.{IndicatorType.TOTAL3.value}",
-                json.dumps(data)
+                IndicatorType.TOTAL3.value,
+                data
             )
 
             elapsed_time = time.time() - start_time
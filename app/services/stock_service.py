@@ -4,21 +4,24 @@ import pytz
 import asyncio
 import random
 import redis
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import logging
-import time
-from curl_cffi import requests
 
 from ..models.stock_models import (
-    INDICES, STOCKS, CRYPTO, FOREX, ALL_SYMBOLS,
+    FOREX, ALL_SYMBOLS,
     AssetType, IndexSymbol, StockSymbol, CryptoSymbol, ForexSymbol
 )
 from app.utils.formatters import format_number, format_market_cap
 from app.core.redis_manager import RedisManager
-from app.constants.app_constants import StreamChannel, TimeConstants
-from app.constants.header_constants import USER_AGENTS, HEADERS_TEMPLATES
+from app.core.session_pool import SessionPool, PooledSession, get_random_headers
+from app.core.upstream_capture import UpstreamCapture
+from app.core.shared_cache import SharedCache
+from app.core.snapshot_writer import SnapshotWriter
+from app.services.candle_aggregator import CandleAggregator
+from app.services.cross_rates import CrossRateEngine
+from app.constants.app_constants import StreamChannel, TimeConstants, CacheConstants
+from app.utils.trading_calendar import get_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,12 @@ class StockService:
     def __init__(self):
         self.timezone = pytz.timezone('America/New_York')
         self.redis_client = RedisManager().client
+        self.session_pool = SessionPool()
+        self.candles = CandleAggregator()
+        self.capture = UpstreamCapture()
+        self.cache = SharedCache()
+        self.snapshot_writer = SnapshotWriter()
+        self.cross_rates = CrossRateEngine()
         self.channels = {
             AssetType.INDEX.value.lower(): StreamChannel.INDEX.value,
             AssetType.STOCK.value.lower(): StreamChannel.STOCK.value,
@@ -35,6 +44,7 @@ class StockService:
         }
         self.error_count = 0
         self.error_threshold = TimeConstants.ERROR_THRESHOLD
+        self.idle_groups = set()
 
     async def handle_rate_limit(self):
         self.error_count += 1
@@ -46,20 +56,51 @@ class StockService:
         else:
             await asyncio.sleep(TimeConstants.DEFAULT_RETRY_DELAY)
 
+    def should_fetch(self, group_type: str) -> bool:
+        """거래 시간대가 아니면 마감 후 한 번만 갱신하고 이후 사이클은 건너뛴다"""
+        if self.capture.replaying:
+            return True  # 재생 데이터는 실제 시각과 무관
+
+        if get_calendar(group_type).is_trading_window(datetime.now(self.timezone)):
+            self.idle_groups.discard(group_type)
+            return True
+
+        if group_type in self.idle_groups:
+            return False
+        self.idle_groups.add(group_type)
+        return True
+
+    def acquire_session(self) -> Optional[PooledSession]:
+        """업스트림 세션 (재생 모드에서는 네트워크를 쓰지 않으므로 None)"""
+        if self.capture.replaying:
+            return None
+        return self.session_pool.acquire()
+
     def get_random_headers(self):
-        headers = random.choice(HEADERS_TEMPLATES).copy()
-        headers['User-Agent'] = random.choice(USER_AGENTS)
-        return headers
+        return get_random_headers()
 
-    async def fetch_single_ticker(self, symbol: str, session: requests.Session) -> Dict[str, Any]:
+    async def get_ticker_info(self, symbol: str,
+                              pooled: Optional[PooledSession]) -> Optional[Dict[str, Any]]:
+        """Ticker.info 조회 (record/replay 모드 지원)"""
+        if self.capture.replaying:
+            return await self.capture.replay('ticker_info', symbol)
+
+        # 동기 HTTP 요청이므로 이벤트 루프 밖에서 실행
+        info = await asyncio.to_thread(lambda: yf.Ticker(symbol).info)
+        self.capture.record('ticker_info', symbol, info)
+        return info
+
+    async def fetch_single_ticker(self, symbol: str, pooled: Optional[PooledSession]) -> Dict[str, Any]:
         try:
-            ticker = yf.Ticker(symbol, session=session)
-            info = ticker.info
+            info = await self.get_ticker_info(symbol, pooled)
 
             if info is None:  # info가 None인 경우 처리
                 raise Exception(f"Failed to get info for {symbol}")
 
             self.error_count = 0
+            self.session_pool.report_success(pooled)
+            if self.capture.replaying:
+                return symbol, info
             await asyncio.sleep(random.uniform(
                 TimeConstants.RANDOM_DELAY_MIN,
                 TimeConstants.RANDOM_DELAY_MAX
@@ -67,188 +108,242 @@ class StockService:
             return symbol, info
         except Exception as e:
             logger.error(f"Error fetching {symbol}: {str(e)}")
+            self.session_pool.report_failure(pooled, e)
             await self.handle_rate_limit()
             raise
 
-    async def process_and_publish_group(self, symbols: list, group_type: str) -> None:
-        try:
-            logger.info(f"Starting {group_type} data collection...")
-            session = requests.Session(impersonate="chrome")
-            session.headers.update(self.get_random_headers())
+    def normalize_quote(self, group_type: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Ticker.info 를 그룹별 발행 포맷으로 변환"""
+        if group_type == AssetType.INDEX.value:
+            return {
+                "current_value": format_number(info.get('regularMarketPrice')),
+                "change": format_number(info.get('regularMarketChange')),
+                "change_percent": format_number(info.get('regularMarketChangePercent'))
+            }
+        elif group_type == AssetType.STOCK.value:
+            market_state = info.get('marketState', 'CLOSED')
+            otc_price = None
+            otc_change = None
+            otc_change_percent = None
+
+            if market_state != 'REGULAR':
+                if market_state == 'PRE':
+                    otc_price = info.get('preMarketPrice')
+                    otc_change = info.get('preMarketChange')
+                    otc_change_percent = info.get(
+                        'preMarketChangePercent')
+                else:
+                    otc_price = info.get('postMarketPrice')
+                    otc_change = info.get('postMarketChange')
+                    otc_change_percent = info.get(
+                        'postMarketChangePercent')
 
-            start_time = time.time()
-            result = {}
+            return {
+                "current_price": format_number(info.get('regularMarketPrice')),
+                "market_cap": format_market_cap(info.get("marketCap")),
+                "change": format_number(info.get('regularMarketChange')),
+                "change_percent": format_number(info.get('regularMarketChangePercent')),
+                "market_state": market_state,
+                "otc_price": format_number(otc_price) if otc_price else None,
+                "otc_change": format_number(otc_change) if otc_change else None,
+                "otc_change_percent": format_number(otc_change_percent) if otc_change_percent else None
+            }
+        elif group_type == AssetType.CRYPTO.value:
+            return {
+                "current_price": format_number(info.get('regularMarketPrice')),
+                "market_cap": format_market_cap(info.get("marketCap")),
+                "change": format_number(info.get('regularMarketChange')),
+                "change_percent": format_number(info.get('regularMarketChangePercent'))
+            }
+        elif group_type == AssetType.FOREX.value:
+            return {
+                "rate": format_number(info.get('regularMarketPrice')),
+                "change": format_number(info.get('regularMarketChange')),
+                "change_percent": format_number(info.get('regularMarketChangePercent'))
+            }
+        return {}
 
-            for symbol in symbols:
-                try:
-                    symbol, info = await self.fetch_single_ticker(symbol, session)
-                    data = {}
-
-                    if group_type == AssetType.INDEX.value:
-                        data = {
-                            "current_value": format_number(info.get('regularMarketPrice')),
-                            "change": format_number(info.get('regularMarketChange')),
-                            "change_percent": format_number(info.get('regularMarketChangePercent'))
-                        }
-                    elif group_type == AssetType.STOCK.value:
-                        market_state = info.get('marketState', 'CLOSED')
-                        otc_price = None
-                        otc_change = None
-                        otc_change_percent = None
-
-                        if market_state != 'REGULAR':
-                            if market_state == 'PRE':
-                                otc_price = info.get('preMarketPrice')
-                                otc_change = info.get('preMarketChange')
-                                otc_change_percent = info.get(
-                                    'preMarketChangePercent')
-                            else:
-                                otc_price = info.get('postMarketPrice')
-                                otc_change = info.get('postMarketChange')
-                                otc_change_percent = info.get(
-                                    'postMarketChangePercent')
-
-                        data = {
-                            "current_price": format_number(info.get('regularMarketPrice')),
-                            "market_cap": format_market_cap(info.get("marketCap")),
-                            "change": format_number(info.get('regularMarketChange')),
-                            "change_percent": format_number(info.get('regularMarketChangePercent')),
-                            "market_state": market_state,
-                            "otc_price": format_number(otc_price) if otc_price else None,
-                            "otc_change": format_number(otc_change) if otc_change else None,
-                            "otc_change_percent": format_number(otc_change_percent) if otc_change_percent else None
-                        }
-                    elif group_type == AssetType.CRYPTO.value:
-                        data = {
-                            "current_price": format_number(info.get('regularMarketPrice')),
-                            "market_cap": format_market_cap(info.get("marketCap")),
-                            "change": format_number(info.get('regularMarketChange')),
-                            "change_percent": format_number(info.get('regularMarketChangePercent'))
-                        }
-
-                    if data:
-                        result[symbol] = data
-                except Exception as e:
-                    logger.error(f"Failed to process {symbol}: {str(e)}")
-                    continue  # 한 심볼이 실패해도 계속 진행
+    @staticmethod
+    def quote_price(data: Dict[str, Any]) -> Optional[str]:
+        return data.get('current_price') or data.get('current_value') or data.get('rate')
 
-            if result:
-                # 스트림 발행
-                self.redis_client.publish(
-                    self.channels[group_type.lower()],
-                    json.dumps(result)
-                )
-                # 스냅샷 저장
-                self.redis_client.set(
-                    f"snapshot.{group_type.lower()}",
-                    json.dumps(result)
-                )
+    def quote_tick(self, group_type: str, info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """발행할 시세 + 캔들용 시세 시각 (regularMarketTime, 없으면 None)"""
+        quote = self.normalize_quote(group_type, info)
+        if not quote:
+            return None
+        return {"quote": quote, "market_time": info.get('regularMarketTime')}
 
-            elapsed_time = time.time() - start_time
-            logger.info(
-                f"{group_type} data published. Took {elapsed_time:.2f} seconds")
+    async def fetch_forex_info(self, symbol: str, pooled: Optional[PooledSession]) -> Dict[str, Any]:
+        try:
+            info = await self.get_ticker_info(symbol, pooled)
         except Exception as e:
-            logger.error(f"Error publishing {group_type} data: {str(e)}")
+            self.session_pool.report_failure(pooled, e)
             raise
+        self.session_pool.report_success(pooled)
+        return info
+
+    async def fetch_forex_quote(self, symbol: str,
+                                pooled: Optional[PooledSession]) -> Optional[Dict[str, Any]]:
+        async def fetch():
+            info = await self.fetch_forex_info(symbol, pooled)
+            return self.quote_tick(AssetType.FOREX.value, info)
+
+        return await self.cache.get_or_fetch(f"tick.{symbol}", CacheConstants.QUOTE_TTL, fetch)
+
+    async def fetch_forex_leg(self, symbol: str, pooled: Optional[PooledSession]) -> Dict[str, Any]:
+        """크로스 계산용 USD 레그 (반올림 전 현재가/전일 종가)"""
+        async def fetch():
+            info = await self.fetch_forex_info(symbol, pooled)
+            return self.cross_rates.leg_from_info(info)
+
+        return await self.cache.get_or_fetch(f"forex.leg.{symbol}", CacheConstants.QUOTE_TTL, fetch)
 
     async def process_forex(self) -> None:
         try:
-            session = requests.Session(impersonate="chrome")
-            session.headers.update(self.get_random_headers())
-            result = {}
+            if not self.should_fetch(AssetType.FOREX.value):
+                logger.debug("FOREX market closed, skipping collection")
+                return
+
+            pooled = self.acquire_session()
+
+            # 크로스 환율은 통화별 USD 레그로 계산하고 나머지(DXY)만 직접 조회
+            legs = {}
+            for currency, symbol in self.cross_rates.legs.items():
+                legs[currency] = await self.fetch_forex_leg(symbol, pooled)
+            quotes = self.cross_rates.compute(legs)
+            market_times = {symbol: self.cross_rates.market_time(legs, symbol) for symbol in quotes}
 
             for symbol in FOREX:
-                ticker = yf.Ticker(symbol, session=session)
-                info = ticker.info
-                result[symbol] = {
-                    "rate": format_number(info.get('regularMarketPrice')),
-                    "change": format_number(info.get('regularMarketChange')),
-                    "change_percent": format_number(info.get('regularMarketChangePercent'))
-                }
+                if symbol not in self.cross_rates.pairs:
+                    tick = await self.fetch_forex_quote(symbol, pooled)
+                    if tick:
+                        quotes[symbol] = tick["quote"]
+                        market_times[symbol] = tick["market_time"]
+
+            result = {}
+            for symbol in FOREX + self.cross_rates.symbols:
+                if symbol in quotes and symbol not in result:
+                    result[symbol] = quotes[symbol]
+                    self.candles.add_tick(symbol, quotes[symbol]['rate'], market_times[symbol])
 
             if result:
-                # 스트림 발행
-                self.redis_client.publish(
+                # 스트림 발행 + 스냅샷 저장
+                self.snapshot_writer.publish(
                     self.channels['forex'],
-                    json.dumps(result)
-                )
-                # 스냅샷 저장
-                self.redis_client.set(
-                    "snapshot.forex",
-                    json.dumps(result)
+                    'forex',
+                    result
                 )
 
         except Exception as e:
             logger.error(f"Error publishing FOREX data: {str(e)}")
             raise
 
-    async def get_current_market_data(self) -> Dict[str, Dict[str, Any]]:
-        try:
-            await self.process_and_publish_group(INDICES, AssetType.INDEX.value)
-            await self.process_and_publish_group(STOCKS, AssetType.STOCK.value)
-            await self.process_and_publish_group(CRYPTO, AssetType.CRYPTO.value)
-            await self.process_forex()
+    def download_chart(self, symbol: str, start: str, end: str) -> pd.DataFrame:
+        """단일 심볼 일봉 다운로드 (스레드에서 실행, 세션은 YfData 공유 세션 사용)"""
+        if self.capture.replaying:
+            frame = self.capture.replay_sync('chart_history', symbol)
+        else:
+            frame = yf.Ticker(symbol).history(
+                start=start,
+                end=end,
+                interval="1d",
+                prepost=True,
+                actions=False,
+                raise_errors=True
+            )
+            self.capture.record('chart_history', symbol, frame)
+        if frame.empty:
+            raise Exception(f"Empty chart data for {symbol}")
+        # yf.download(ignore_tz=True) 와 동일하게 타임존 제거
+        frame.index = frame.index.tz_localize(None)
+        return frame
+
+    async def fetch_charts(self, symbols: List[str], start: str, end: str,
+                           pooled: Optional[PooledSession]) -> Dict[str, pd.DataFrame]:
+        """심볼별로 스레드에서 동시에 다운로드 (실패한 심볼은 결과에서 제외)"""
+        semaphore = asyncio.Semaphore(TimeConstants.CHART_DOWNLOAD_CONCURRENCY)
+
+        async def fetch(symbol: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                try:
+                    frame = await asyncio.to_thread(self.download_chart, symbol, start, end)
+                except Exception as e:
+                    logger.error(f"Error downloading chart for {symbol}: {str(e)}")
+                    self.session_pool.report_failure(pooled, e)
+                    return None
+                self.session_pool.report_success(pooled)
+                return frame
+
+        frames = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        return {symbol: frame for symbol, frame in zip(symbols, frames) if frame is not None}
+
+    def extract_chart(self, frame: pd.DataFrame) -> Dict[str, Dict[str, str]]:
+        symbol_data = {}
+
+        # 최근 30 거래일만 사용
+        valid_dates = [d for d in frame.index if not pd.isna(
+            frame["Close"].loc[d])][-TimeConstants.CHART_DAYS:]
+
+        for timestamp in valid_dates:
+            close_value = frame["Close"].loc[timestamp]
+            utc_time = pytz.utc.localize(
+                timestamp) if timestamp.tzinfo is None else timestamp
+            et_time = utc_time.astimezone(self.timezone)
+            et_timestamp = et_time.strftime("%Y-%m-%d")
+
+            symbol_data[et_timestamp] = {
+                "close": format_number(close_value)
+            }
 
-            logger.info("All market data published successfully")
-            return {"status": "success", "message": "Data published to respective channels"}
-        except Exception as e:
-            raise Exception(f"Failed to fetch market data: {str(e)}")
+        return symbol_data
 
-    async def get_chart_data(self) -> Dict[str, Any]:
+    async def get_chart_data(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get last 30 trading days of daily chart data for all symbols"""
         try:
-            session = requests.Session(impersonate="chrome")
-            session.headers.update(self.get_random_headers())
-
+            symbols = symbols or ALL_SYMBOLS
             end_date = datetime.now(self.timezone)
-            start_date = end_date - timedelta(days=45)
-
-            main_data = yf.download(
-                tickers=" ".join(ALL_SYMBOLS),
-                start=start_date.strftime('%Y-%m-%d'),
-                end=end_date.strftime('%Y-%m-%d'),
-                interval="1d",
-                prepost=True,
-                group_by='ticker',
-                session=session
-            )
+            start_date = end_date - timedelta(days=TimeConstants.CHART_BUFFER_DAYS)
+            start, end = start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+
+            pooled = self.acquire_session()
+            frames = await self.fetch_charts(symbols, start, end, pooled)
+
+            # 실패한 심볼은 개별적으로 재시도
+            failed = [symbol for symbol in symbols if symbol not in frames]
+            for attempt in range(TimeConstants.CHART_RETRY_ATTEMPTS):
+                if not failed:
+                    break
+                logger.warning(
+                    f"Retrying chart download for {failed} (attempt {attempt + 1})")
+                await asyncio.sleep(TimeConstants.DEFAULT_RETRY_DELAY)
+                pooled = self.acquire_session()
+                frames.update(await self.fetch_charts(failed, start, end, pooled))
+                failed = [symbol for symbol in failed if symbol not in frames]
+
+            if not frames:
+                raise Exception("No chart data downloaded")
+
+            frame_bytes = sum(int(frame.memory_usage(deep=True).sum()) for frame in frames.values())
+            logger.info(
+                f"Chart frames hold {frame_bytes / 1024:.1f} KB for {len(frames)} symbols")
 
             result = {}
-
-            for symbol in ALL_SYMBOLS:
-                symbol_data = {}
-                data_view = main_data[symbol] if len(
-                    ALL_SYMBOLS) > 1 else main_data
-
-                # 최근 30 거래일만 사용
-                valid_dates = [d for d in data_view.index if not pd.isna(
-                    data_view["Close"].loc[d])][-30:]
-
-                for timestamp in valid_dates:
-                    close_value = data_view["Close"].loc[timestamp]
-                    utc_time = pytz.utc.localize(
-                        timestamp) if timestamp.tzinfo is None else timestamp
-                    et_time = utc_time.astimezone(self.timezone)
-                    et_timestamp = et_time.strftime("%Y-%m-%d")
-
-                    symbol_data[et_timestamp] = {
-                        "close": format_number(close_value)
-                    }
-
+            for symbol, frame in frames.items():
+                symbol_data = self.extract_chart(frame)
                 if symbol_data:
                     result[symbol] = symbol_data
 
-            trading_date = None
-            if main_data.index.size > 0:
-                first_timestamp = main_data.index[-1]
-                et_time = (pytz.utc.localize(
-                    first_timestamp) if first_timestamp.tzinfo is None else first_timestamp).astimezone(self.timezone)
-                trading_date = et_time.strftime('%Y-%m-%d')
+            last_timestamp = max(frame.index[-1] for frame in frames.values())
+            et_time = (pytz.utc.localize(
+                last_timestamp) if last_timestamp.tzinfo is None else last_timestamp).astimezone(self.timezone)
+            trading_date = et_time.strftime('%Y-%m-%d')
 
             return {
                 "interval": "1d",
                 "period": "30d",
                 "data": result,
+                "failed": failed,
                 "trading_date": trading_date,
                 "timezone": "America/New_York (ET)",
                 "market_hours": "9:30 AM - 4:00 PM ET (Regular Market Hours)"
@@ -0,0 +1,201 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..constants.app_constants import IndicatorConstants
+from ..models.stock_models import AssetType
+
+
+def parse_specs(raw: str) -> List[Tuple[str, int]]:
+    """"sma:5,rsi:14" -> [("sma", 5), ("rsi", 14)]"""
+    specs = []
+    for item in raw.split(','):
+        kind, _, window = item.strip().partition(':')
+        if kind in ('sma', 'ema', 'rsi', 'volatility') and window.isdigit() and int(window) > 1:
+            specs.append((kind, int(window)))
+    return specs
+
+
+def ema_series(values: np.ndarray, alpha: float) -> np.ndarray:
+    """values[0] 으로 시작하는 지수이동평균 (재귀식을 누적합으로 벡터화)"""
+    decay = (1 - alpha) ** np.arange(len(values))
+    scaled = np.concatenate((values[:1], alpha * values[1:])) / decay
+    return np.cumsum(scaled) * decay
+
+
+def sma_series(closes: np.ndarray, window: int) -> np.ndarray:
+    result = np.full(len(closes), np.nan)
+    if len(closes) >= window:
+        cumsum = np.cumsum(np.concatenate(([0.0], closes)))
+        result[window - 1:] = (cumsum[window:] - cumsum[:-window]) / window
+    return result
+
+
+def rsi_series(closes: np.ndarray, window: int) -> Tuple[np.ndarray, Optional[dict]]:
+    """Wilder RSI 와 마지막 평균 상승/하락폭"""
+    result = np.full(len(closes), np.nan)
+    if len(closes) <= window:
+        return result, None
+
+    diffs = np.diff(closes)
+    gains, losses = np.clip(diffs, 0, None), np.clip(-diffs, 0, None)
+    # 첫 평균은 단순평균, 이후 Wilder 평활 (alpha = 1/window)
+    avg_gain = ema_series(np.concatenate(([gains[:window].mean()], gains[window:])), 1 / window)
+    avg_loss = ema_series(np.concatenate(([losses[:window].mean()], losses[window:])), 1 / window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result[window:] = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return result, {"avg_gain": float(avg_gain[-1]), "avg_loss": float(avg_loss[-1])}
+
+
+def volatility_series(closes: np.ndarray, window: int, days: int) -> Tuple[np.ndarray, Optional[dict]]:
+    """로그수익률 표본표준편차 기반 연율화 변동성 (%)"""
+    result = np.full(len(closes), np.nan)
+    if len(closes) <= window:
+        return result, None
+
+    returns = np.diff(np.log(closes))
+    s1 = np.cumsum(np.concatenate(([0.0], returns)))
+    s2 = np.cumsum(np.concatenate(([0.0], returns ** 2)))
+    window_sum = s1[window:] - s1[:-window]
+    window_sumsq = s2[window:] - s2[:-window]
+    variance = np.clip((window_sumsq - window_sum ** 2 / window) / (window - 1), 0, None)
+    result[window:] = np.sqrt(variance * days) * 100
+    return result, {"sum": float(window_sum[-1]), "sumsq": float(window_sumsq[-1])}
+
+
+def to_list(series: np.ndarray) -> List[Optional[float]]:
+    return [None if math.isnan(value) else round(float(value), 4) for value in series]
+
+
+# 시작 값에 따라 이후 값이 모두 달라지는 지표 (차트 구간이 밀리면 증분 결과가 달라짐)
+PATH_DEPENDENT = ('ema', 'rsi')
+
+
+class IndicatorEngine:
+    """차트 종가로 기술적 지표를 계산
+
+    sma/volatility 는 구간 안의 값만 쓰므로 새 봉만 증분 갱신하고, ema/rsi 는
+    차트 첫 봉에서 시작하는 값이라 매번 현재 차트 전체로 다시 계산한다.
+    따라서 결과는 실행 이력(재시작, 스펙 변경, 봉 수정)과 무관하게 현재 차트로만 정해진다.
+    """
+
+    def __init__(self, specs: Optional[str] = None):
+        self.specs = parse_specs(specs or IndicatorConstants.SPECS)
+        self.labels = [f"{kind}:{window}" for kind, window in self.specs]
+
+    @staticmethod
+    def annualization(asset_type: str) -> int:
+        if asset_type.upper() == AssetType.CRYPTO.value:
+            return IndicatorConstants.CRYPTO_DAYS
+        return IndicatorConstants.TRADING_DAYS
+
+    def compute(self, symbol: str, asset_type: str, chart_data: Dict[str, Dict[str, str]],
+                stored_at: str, previous: Optional[dict] = None) -> Optional[dict]:
+        """지표 레코드 반환 (이전 결과 대비 새 봉이 없으면 None)"""
+        dates = sorted(chart_data)
+        if not dates:
+            return None
+        closes = np.array([float(chart_data[day]["close"]) for day in dates])
+
+        start = self.incremental_start(previous, dates, closes)
+        if start == len(dates):
+            return None
+        if start is None:
+            record = self.full(dates, closes, asset_type)
+        else:
+            record = self.incremental(previous, dates, closes, asset_type, start)
+
+        record.update({
+            "symbol": symbol,
+            "stored_at": stored_at,
+            "specs": self.labels,
+            "dates": dates,
+            "last_date": dates[-1],
+            "last_close": float(closes[-1]),
+            "values": {label: series[-1] for label, series in record["series"].items()}
+        })
+        return record
+
+    def incremental_start(self, previous: Optional[dict], dates: List[str],
+                          closes: np.ndarray) -> Optional[int]:
+        """증분 갱신을 시작할 인덱스 (불가능하면 None)"""
+        if not previous or previous.get("specs") != self.labels:
+            return None
+        last_date = previous.get("last_date")
+        if last_date not in dates:
+            return None
+
+        index = dates.index(last_date)
+        overlap = previous.get("dates", [])[-(index + 1):]
+        # 과거 데이터가 수정되었으면 전체 재계산
+        if overlap != dates[:index + 1] or closes[index] != previous.get("last_close"):
+            return None
+        return index + 1
+
+    @staticmethod
+    def spec_series(kind: str, window: int, closes: np.ndarray, days: int) -> Tuple[np.ndarray, Optional[dict]]:
+        """지표 하나의 전체 시리즈와 다음 증분 갱신용 상태"""
+        if kind in ('sma', 'ema'):
+            values = sma_series(closes, window) if kind == 'sma' else ema_series(closes, 2 / (window + 1))
+            # 반올림 전 값을 보관해 증분 갱신 시 오차가 쌓이지 않게 한다
+            return values, None if math.isnan(values[-1]) else {"value": float(values[-1])}
+        if kind == 'rsi':
+            return rsi_series(closes, window)
+        return volatility_series(closes, window, days)
+
+    def full(self, dates: List[str], closes: np.ndarray, asset_type: str) -> dict:
+        series, state = {}, {}
+        days = self.annualization(asset_type)
+        for (kind, window), label in zip(self.specs, self.labels):
+            values, state[label] = self.spec_series(kind, window, closes, days)
+            series[label] = to_list(values)
+        return {"series": series, "state": state}
+
+    def incremental(self, previous: dict, dates: List[str], closes: np.ndarray,
+                    asset_type: str, start: int) -> dict:
+        """start 이후 새 봉만 sma/volatility 갱신 (ema/rsi 는 현재 차트로 재계산)"""
+        series = {label: previous["series"][label][-start:] for label in self.labels}
+        state = {label: dict(value) for label, value in previous.get("state", {}).items()
+                 if value is not None}
+        days = self.annualization(asset_type)
+
+        for (kind, window), label in zip(self.specs, self.labels):
+            if kind in PATH_DEPENDENT:
+                values, state[label] = self.spec_series(kind, window, closes, days)
+                series[label] = to_list(values)
+            else:
+                # 앞쪽 봉은 구간이 현재 차트를 벗어나므로 전체 계산과 같게 비운다
+                warmup = min(window - 1 if kind == 'sma' else window, start)
+                series[label][:warmup] = [None] * warmup
+
+        for index in range(start, len(dates)):
+            close = closes[index]
+            for (kind, window), label in zip(self.specs, self.labels):
+                if kind in PATH_DEPENDENT:
+                    continue
+                value = None
+
+                if kind == 'sma':
+                    last = state.get(label)
+                    if last is not None and index >= window:
+                        value = last["value"] + (close - closes[index - window]) / window
+                    elif index >= window - 1:
+                        value = float(closes[index - window + 1:index + 1].mean())
+                    if value is not None:
+                        state[label] = {"value": value}
+                else:
+                    sums = state.get(label)
+                    if sums is None or index <= window:
+                        return self.full(dates, closes, asset_type)
+                    new_return = math.log(close / closes[index - 1])
+                    old_return = math.log(closes[index - window] / closes[index - window - 1])
+                    sums["sum"] += new_return - old_return
+                    sums["sumsq"] += new_return ** 2 - old_return ** 2
+                    variance = max(
+                        (sums["sumsq"] - sums["sum"] ** 2 / window) / (window - 1), 0)
+                    value = math.sqrt(variance * days) * 100
+
+                series[label].append(None if value is None else round(float(value), 4))
+
+        return {"series": series, "state": state}
@@ -0,0 +1,126 @@
+import base64
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from ..models.data_models import ColumnarChartData
+
+# 압축 포맷: 일수/센트 단위 종가의 차분을 zigzag varint 로 연결한 바이트열
+PACKED_ENCODING = 'delta-varint'
+
+
+def pack_deltas(values: List[int]) -> bytes:
+    """정수 목록 -> 이전 값과의 차분을 zigzag varint 로 인코딩"""
+    packed = bytearray()
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        number = (delta << 1) ^ (delta >> 63)  # zigzag: 작은 음수도 짧게
+        while number >= 0x80:
+            packed.append((number & 0x7F) | 0x80)
+            number >>= 7
+        packed.append(number)
+    return bytes(packed)
+
+
+def unpack_deltas(data: bytes, count: int, position: int = 0) -> Tuple[List[int], int]:
+    """pack_deltas 역변환 (값 목록과 다음 읽을 위치 반환)"""
+    values = []
+    previous = 0
+    for _ in range(count):
+        number = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            number |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        previous += (number >> 1) ^ -(number & 1)
+        values.append(previous)
+    return values, position
+
+
+class ChartSeries:
+    """start 날짜 + 일수 오프셋 배열 + 종가 배열로 표현한 차트"""
+
+    def __init__(self, symbol: str, type: str, stored_at: str, start: date,
+                 offsets: array, closes: array):
+        self.symbol = symbol
+        self.type = type
+        self.stored_at = stored_at
+        self.start = start
+        self.offsets = offsets
+        self.closes = closes
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    @property
+    def dates(self) -> List[str]:
+        return [(self.start + timedelta(days=offset)).isoformat() for offset in self.offsets]
+
+    def _offset(self, day: str) -> int:
+        return (date.fromisoformat(day) - self.start).days
+
+    def slice(self, start: Optional[str] = None, end: Optional[str] = None) -> 'ChartSeries':
+        """[start, end] 날짜 범위 (YYYY-MM-DD, 양끝 포함)"""
+        lo = bisect_left(self.offsets, self._offset(start)) if start else 0
+        hi = bisect_right(self.offsets, self._offset(end)) if end else len(self.offsets)
+        return ChartSeries(self.symbol, self.type, self.stored_at, self.start,
+                           self.offsets[lo:hi], self.closes[lo:hi])
+
+    def to_chart_data(self) -> Dict[str, Dict[str, str]]:
+        """기존 StoredChartData.chart_data 형태로 변환"""
+        return {day: {"close": f"{close:.2f}"} for day, close in zip(self.dates, self.closes)}
+
+
+def encode_chart(type: str, symbol: str, stored_at: str,
+                 chart_data: Dict[str, Dict[str, str]], compress: bool = False) -> str:
+    """{"YYYY-MM-DD": {"close": "123.45"}} 형태를 컬럼형 JSON 으로 변환"""
+    days = sorted(chart_data)
+    start = date.fromisoformat(days[0]) if days else date.today()
+    offsets = [(date.fromisoformat(day) - start).days for day in days]
+    closes = [round(float(chart_data[day]["close"]), 2) for day in days]
+
+    stored = ColumnarChartData(type=type, symbol=symbol, stored_at=stored_at,
+                               start=start.isoformat())
+    if compress:
+        cents = [round(close * 100) for close in closes]
+        stored.count = len(closes)
+        stored.encoding = PACKED_ENCODING
+        stored.packed = base64.b64encode(pack_deltas(offsets) + pack_deltas(cents)).decode('ascii')
+    else:
+        stored.offsets = offsets
+        stored.close = closes
+    return stored.model_dump_json(exclude_none=True)
+
+
+def decode_chart(raw: str) -> ChartSeries:
+    """컬럼형 / 압축 / 기존(StoredChartData) 포맷을 모두 읽는다"""
+    payload = json.loads(raw)
+
+    if "chart_data" in payload:
+        chart_data = payload["chart_data"]
+        days = sorted(chart_data)
+        start = date.fromisoformat(days[0]) if days else date.today()
+        offsets = array('H', [(date.fromisoformat(day) - start).days for day in days])
+        closes = array('d', [float(chart_data[day]["close"]) for day in days])
+    else:
+        start = date.fromisoformat(payload["start"])
+        if payload.get("encoding") == PACKED_ENCODING:
+            count = payload["count"]
+            raw = base64.b64decode(payload["packed"])
+            day_offsets, position = unpack_deltas(raw, count)
+            cents, _ = unpack_deltas(raw, count, position)
+            offsets = array('H', day_offsets)
+            closes = array('d', [value / 100 for value in cents])
+        else:
+            offsets = array('H', payload.get("offsets", []))
+            closes = array('d', payload.get("close", []))
+
+    return ChartSeries(payload.get("symbol"), payload.get("type"), payload.get("stored_at"),
+                       start, offsets, closes)
@@ -0,0 +1,219 @@
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+
+import pytz
+
+from ..models.stock_models import AssetType
+
+ET = pytz.timezone('America/New_York')
+
+
+def easter_sunday(year: int) -> date:
+    """그레고리력 부활절 (Anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def observed(day: date) -> date:
+    """토요일 휴일은 금요일, 일요일 휴일은 월요일에 쉰다"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    holidays = {
+        nth_weekday(year, 1, 0, 3),                # Martin Luther King Jr. Day
+        nth_weekday(year, 2, 0, 3),                # Washington's Birthday
+        easter_sunday(year) - timedelta(days=2),   # Good Friday
+        last_weekday(year, 5, 0),                  # Memorial Day
+        observed(date(year, 7, 4)),                # Independence Day
+        nth_weekday(year, 9, 0, 1),                # Labor Day
+        nth_weekday(year, 11, 3, 4),               # Thanksgiving Day
+        observed(date(year, 12, 25)),              # Christmas Day
+    }
+    # 새해가 토요일이면 전년도 12/31 은 휴장하지 않는다
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(observed(new_year))
+    if year >= 2022:
+        holidays.add(observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=None)
+def nyse_early_closes(year: int) -> FrozenSet[date]:
+    """13:00 조기 폐장일 (독립기념일 전날, 추수감사절 다음날, 크리스마스 이브)"""
+    holidays = nyse_holidays(year)
+    candidates = (
+        date(year, 7, 3),
+        nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    )
+    return frozenset(
+        day for day in candidates if day.weekday() < 5 and day not in holidays)
+
+
+class TradingCalendar(ABC):
+    """연도별 세션 인덱스(정렬된 ordinal 배열)를 캐시하는 거래 캘린더"""
+    name = 'base'
+
+    def __init__(self):
+        self._year_indexes: Dict[int, array] = {}
+
+    @abstractmethod
+    def is_session_day(self, day: date) -> bool:
+        """주말/휴장일 규칙으로 세션 여부 판단 (인덱스 생성용)"""
+
+    @abstractmethod
+    def trading_window(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """해당 세션의 (연장 거래 포함) 시작/종료 시각 (ET)"""
+
+    def _year_index(self, year: int) -> array:
+        index = self._year_indexes.get(year)
+        if index is None:
+            start = date(year, 1, 1).toordinal()
+            end = date(year + 1, 1, 1).toordinal()
+            index = self._year_indexes[year] = array('l', (
+                ordinal for ordinal in range(start, end)
+                if self.is_session_day(date.fromordinal(ordinal))
+            ))
+        return index
+
+    def is_session(self, day: date) -> bool:
+        index = self._year_index(day.year)
+        position = bisect_left(index, day.toordinal())
+        return position < len(index) and index[position] == day.toordinal()
+
+    def next_session(self, day: date) -> date:
+        """day 이후(미포함) 첫 세션"""
+        year = day.year
+        while True:
+            index = self._year_index(year)
+            position = bisect_right(index, day.toordinal())
+            if position < len(index):
+                return date.fromordinal(index[position])
+            year += 1
+
+    def previous_session(self, day: date) -> date:
+        """day 이전(미포함) 마지막 세션"""
+        year = day.year
+        while True:
+            index = self._year_index(year)
+            position = bisect_left(index, day.toordinal())
+            if position > 0:
+                return date.fromordinal(index[position - 1])
+            year -= 1
+
+    def is_trading_window(self, now: Optional[datetime] = None) -> bool:
+        """지금 시세가 바뀔 수 있는 시간대인지"""
+        now = (now or datetime.now(ET)).astimezone(ET)
+        for day in (now.date(), now.date() + timedelta(days=1)):
+            window = self.trading_window(day)
+            if window and window[0] <= now < window[1]:
+                return True
+        return False
+
+
+class EquityCalendar(TradingCalendar):
+    """NYSE 정규장 + 프리/애프터마켓 (04:00 - 20:00 ET, 조기 폐장일 17:00)"""
+    name = 'nyse'
+    PRE_MARKET_OPEN = time(4, 0)
+    REGULAR_OPEN = time(9, 30)
+    REGULAR_CLOSE = time(16, 0)
+    EARLY_CLOSE = time(13, 0)
+    POST_MARKET_CLOSE = time(20, 0)
+    EARLY_POST_MARKET_CLOSE = time(17, 0)
+
+    def is_session_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+    def is_early_close(self, day: date) -> bool:
+        return day in nyse_early_closes(day.year)
+
+    def regular_hours(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        if not self.is_session(day):
+            return None
+        close = self.EARLY_CLOSE if self.is_early_close(day) else self.REGULAR_CLOSE
+        return (ET.localize(datetime.combine(day, self.REGULAR_OPEN)),
+                ET.localize(datetime.combine(day, close)))
+
+    def trading_window(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        if not self.is_session(day):
+            return None
+        close = self.EARLY_POST_MARKET_CLOSE if self.is_early_close(day) else self.POST_MARKET_CLOSE
+        return (ET.localize(datetime.combine(day, self.PRE_MARKET_OPEN)),
+                ET.localize(datetime.combine(day, close)))
+
+
+class ForexCalendar(TradingCalendar):
+    """외환 시장 (일요일 17:00 ET - 금요일 17:00 ET, 평일 세션)"""
+    name = 'forex'
+    ROLLOVER = time(17, 0)
+
+    def is_session_day(self, day: date) -> bool:
+        return day.weekday() < 5
+
+    def trading_window(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        if not self.is_session(day):
+            return None
+        # 세션은 전날 17:00 에 시작
+        return (ET.localize(datetime.combine(day - timedelta(days=1), self.ROLLOVER)),
+                ET.localize(datetime.combine(day, self.ROLLOVER)))
+
+
+class CryptoCalendar(TradingCalendar):
+    """24/7 시장"""
+    name = 'crypto'
+
+    def is_session_day(self, day: date) -> bool:
+        return True
+
+    def trading_window(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        return (ET.localize(datetime.combine(day, time(0, 0))),
+                ET.localize(datetime.combine(day + timedelta(days=1), time(0, 0))))
+
+    def is_trading_window(self, now: Optional[datetime] = None) -> bool:
+        return True
+
+
+NYSE_CALENDAR = EquityCalendar()
+FOREX_CALENDAR = ForexCalendar()
+CRYPTO_CALENDAR = CryptoCalendar()
+
+CALENDARS: Dict[str, TradingCalendar] = {
+    AssetType.INDEX.value: NYSE_CALENDAR,
+    AssetType.STOCK.value: NYSE_CALENDAR,
+    AssetType.FOREX.value: FOREX_CALENDAR,
+    AssetType.CRYPTO.value: CRYPTO_CALENDAR,
+}
+
+
+def get_calendar(asset_type: str) -> TradingCalendar:
+    return CALENDARS[asset_type.upper()]
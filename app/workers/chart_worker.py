@@ -1,12 +1,18 @@
 import asyncio
+import json
 import logging
 import pytz
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 from ..services.stock_service import StockService
-from ..models.stock_models import INDICES, STOCKS, CRYPTO, FOREX
+from ..models.stock_models import INDICES, STOCKS, CRYPTO, FOREX, AssetType
 from ..core.redis_manager import RedisManager
+from ..core.worker_status import WorkerStatus
 from ..models.data_models import StoredChartData, ChartMetadata
-from ..constants.app_constants import TimeConstants
+from ..constants.app_constants import TimeConstants, ChartStorageConstants
+from ..services.technical_indicators import IndicatorEngine
+from ..utils.chart_codec import encode_chart
+from ..utils.trading_calendar import NYSE_CALENDAR, get_calendar
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,59 +21,126 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+CHART_GROUPS = (
+    (AssetType.INDEX.value, INDICES),
+    (AssetType.STOCK.value, STOCKS),
+    (AssetType.CRYPTO.value, CRYPTO),
+    (AssetType.FOREX.value, FOREX),
+)
+
+
 async def is_market_closed() -> bool:
-    """미국 장이 완전히 종료되었는지 확인 (Post-market 포함)"""
-    et_tz = pytz.timezone('America/New_York')
-    now_et = datetime.now(et_tz)
+    """미국 장이 완전히 종료되었는지 확인 (Post-market 포함, 휴장일/조기 폐장 반영)"""
+    now_et = datetime.now(pytz.timezone('America/New_York'))
+    window = NYSE_CALENDAR.trading_window(now_et.date())
+    return window is None or now_et >= window[1]
 
-    market_close_time = now_et.replace(
-        hour=TimeConstants.MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
 
-    return now_et >= market_close_time
+def get_run_time(day: date) -> datetime:
+    """해당 날짜의 실행 시간 (Post-market 종료 시각, 세션이 없으면 ET 20:00)"""
+    window = NYSE_CALENDAR.trading_window(day)
+    if window:
+        return window[1]
+    return pytz.timezone('America/New_York').localize(
+        datetime.combine(day, datetime.min.time()).replace(hour=TimeConstants.MARKET_CLOSE_HOUR))
 
 
 async def get_next_run_time() -> datetime:
-    """다음 실행 시간 계산 (ET 20:00)"""
-    et_tz = pytz.timezone('America/New_York')
-    now_et = datetime.now(et_tz)
-    target_time = now_et.replace(
-        hour=TimeConstants.MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
+    """다음 실행 시간 계산"""
+    now_et = datetime.now(pytz.timezone('America/New_York'))
+    target_time = get_run_time(now_et.date())
 
     if now_et >= target_time:
-        target_time += timedelta(days=1)
+        target_time = get_run_time(now_et.date() + timedelta(days=1))
 
     return target_time
 
 
+def get_session_symbols(day: date) -> List[str]:
+    """해당 날짜에 세션이 있었던 자산 유형의 심볼만 반환"""
+    return [
+        symbol
+        for asset_type, symbols in CHART_GROUPS
+        if get_calendar(asset_type).is_session(day)
+        for symbol in symbols
+    ]
+
+
+def build_metadata(chart_data: dict) -> ChartMetadata:
+    return ChartMetadata(
+        interval=chart_data['interval'],
+        period=chart_data['period'],
+        timezone=chart_data['timezone'],
+        market_hours=chart_data['market_hours']
+    )
+
+
 async def store_symbol_data(redis_client, symbol: str, type: str, chart_data: dict, stored_time: str):
     """단일 심볼 데이터 저장"""
-    if symbol in chart_data['data']:
+    if symbol not in chart_data['data']:
+        return
+
+    if ChartStorageConstants.FORMAT == 'legacy':
         stored_data = StoredChartData(
             type=type,
             symbol=symbol,
             stored_at=stored_time,
             chart_data=chart_data['data'][symbol],
-            metadata=ChartMetadata(
-                interval=chart_data['interval'],
-                period=chart_data['period'],
-                timezone=chart_data['timezone'],
-                market_hours=chart_data['market_hours']
-            )
+            metadata=build_metadata(chart_data)
         )
         redis_client.set(f"chart.{symbol}", stored_data.model_dump_json())
+        return
+
+    # 컬럼형 포맷 (메타데이터는 chart.metadata 에 한 번만 저장)
+    redis_client.set(
+        f"chart.{symbol}",
+        encode_chart(type, symbol, stored_time, chart_data['data'][symbol],
+                     compress=ChartStorageConstants.COMPRESS)
+    )
+
+
+def store_indicators(redis_client, chart_data: dict, stored_time: str):
+    """수집한 차트로 기술적 지표 갱신 (이전 결과가 있으면 새 봉만 증분 계산)"""
+    symbols = [(symbol, type) for type, group in CHART_GROUPS
+               for symbol in group if symbol in chart_data['data']]
+    if not symbols:
+        return
+
+    engine = IndicatorEngine()
+    keys = [f"chart.{symbol}.indicators" for symbol, _ in symbols]
+    previous_records = redis_client.mget(keys)
+
+    pipe = redis_client.pipeline(transaction=False)
+    updated = 0
+    for (symbol, type), key, previous in zip(symbols, keys, previous_records):
+        try:
+            record = engine.compute(symbol, type, chart_data['data'][symbol], stored_time,
+                                    json.loads(previous) if previous else None)
+        except Exception as e:
+            logger.error(f"Failed to compute indicators for {symbol}: {str(e)}")
+            continue
+        if record is not None:
+            pipe.set(key, json.dumps(record))
+            updated += 1
+    pipe.execute()
+    logger.info(f"Indicators updated for {updated}/{len(symbols)} symbols")
 
 
-async def collect_and_store_data():
+async def collect_and_store_data(symbols: Optional[List[str]] = None):
     """차트 데이터 수집 및 저장"""
     service = StockService()
     redis_client = RedisManager().client
 
     logger.info("Starting chart data collection...")
-    chart_data = await service.get_chart_data()
+    chart_data = await service.get_chart_data(symbols)
 
     stored_time = datetime.now(pytz.timezone(
         'America/New_York')).strftime('%Y-%m-%d %H:%M:%S %Z')
 
+    if ChartStorageConstants.FORMAT != 'legacy':
+        redis_client.set(ChartStorageConstants.METADATA_KEY,
+                         build_metadata(chart_data).model_dump_json())
+
     # 각 자산 유형별로 데이터 저장
     for symbol in INDICES:
         await store_symbol_data(redis_client, symbol, "index", chart_data, stored_time)
@@ -81,21 +154,34 @@ async def collect_and_store_data():
     for symbol in FOREX:
         await store_symbol_data(redis_client, symbol, "forex", chart_data, stored_time)
 
-    logger.info("Chart data stored successfully")
+    await asyncio.to_thread(store_indicators, redis_client, chart_data, stored_time)
+
+    if chart_data['failed']:
+        logger.warning(f"Chart data missing for {chart_data['failed']}")
+    logger.info(
+        f"Chart data stored successfully ({len(chart_data['data'])} symbols)")
 
 
 async def store_chart_data():
     """메인 워커 함수"""
+    worker_status = WorkerStatus()
+    symbols = None  # 첫 실행은 전체 심볼
     while True:
         try:
-            await collect_and_store_data()
+            if symbols is None or symbols:
+                with worker_status.cycle("store_chart_data"):
+                    await collect_and_store_data(symbols)
+            else:
+                logger.info("No trading sessions today, skipping chart data collection")
+
             next_run = await get_next_run_time()
             now = datetime.now(pytz.timezone('America/New_York'))
             wait_seconds = (next_run - now).total_seconds()
 
             logger.info(
                 f"Waiting {wait_seconds/3600:.2f} hours until next chart data collection at {next_run}")
-            await asyncio.sleep(wait_seconds)
+            await worker_status.idle("store_chart_data", wait_seconds)
+            symbols = get_session_symbols(next_run.date())
 
             if not await is_market_closed():
                 logger.warning(
@@ -104,7 +190,7 @@ async def store_chart_data():
 
         except Exception as e:
             logger.error(f"Error storing chart data: {str(e)}")
-            await asyncio.sleep(TimeConstants.ERROR_WAIT_TIME)
+            await worker_status.idle("store_chart_data", TimeConstants.ERROR_WAIT_TIME)
 
 
 async def main():
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from ..services.market_indicators_service import MarketIndicatorsService
+from ..core.worker_status import WorkerStatus
 from ..constants.app_constants import TimeConstants
 
 logging.basicConfig(
@@ -12,16 +13,18 @@ logger = logging.getLogger(__name__)
 
 async def publish_market_indicators():
     service = MarketIndicatorsService()
+    worker_status = WorkerStatus()
 
     while True:
         try:
-            await service.publish_fear_greed_index()
-            await service.publish_btc_dominance()
-            await service.publish_total3()
-            await asyncio.sleep(TimeConstants.DEFAULT_UPDATE_INTERVAL)
+            with worker_status.cycle("publish_market_indicators"):
+                await service.publish_fear_greed_index()
+                await service.publish_btc_dominance()
+                await service.publish_total3()
+            await worker_status.idle("publish_market_indicators", TimeConstants.DEFAULT_UPDATE_INTERVAL)
         except Exception as e:
             logger.error(f"Market indicators publishing error: {str(e)}")
-            await asyncio.sleep(TimeConstants.DEFAULT_RETRY_DELAY)
+            await worker_status.idle("publish_market_indicators", TimeConstants.DEFAULT_RETRY_DELAY)
 
 
 async def main():
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..services.stock_service import StockService
+from ..constants.app_constants import PipelineConstants, CacheConstants
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DEPTH = Gauge(
+    'market_pipeline_queue_depth', 'Items waiting in each market pipeline queue', ['queue'])
+STAGE_ITEMS = Counter(
+    'market_pipeline_items_total', 'Items processed by each market pipeline stage', ['stage'])
+STAGE_ERRORS = Counter(
+    'market_pipeline_errors_total', 'Items failed in each market pipeline stage', ['stage'])
+QUEUE_DROPPED = Counter(
+    'market_pipeline_dropped_total', 'Quotes superseded or evicted before processing', ['queue'])
+STAGE_SECONDS = Histogram(
+    'market_pipeline_stage_seconds', 'Processing time per item in each stage', ['stage'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+
+
+class LatestQuoteQueue:
+    """심볼별 최신 값만 유지하는 bounded 큐
+
+    같은 심볼이 다시 들어오면 이전 값을 버리고(drop-oldest per symbol),
+    가득 차면 가장 오래된 심볼을 버린다. 생산자는 절대 대기하지 않는다.
+    가득 차서 버린 항목은 put_nowait 가 돌려주므로 호출자가 마무리한다.
+    """
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self._items: 'OrderedDict[str, Any]' = OrderedDict()
+        self._not_empty = asyncio.Event()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        QUEUE_DEPTH.labels(queue=name).set_function(self.qsize)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, key: str, item: Any) -> Optional[Any]:
+        evicted = None
+        if key in self._items:
+            del self._items[key]
+            self._drop()
+        elif len(self._items) >= self.maxsize:
+            _, evicted = self._items.popitem(last=False)
+            self._drop()
+
+        self._items[key] = item
+        self._unfinished += 1
+        self._finished.clear()
+        self._not_empty.set()
+        return evicted
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        _, item = self._items.popitem(last=False)
+        return item
+
+    def task_done(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+    def _drop(self) -> None:
+        QUEUE_DROPPED.labels(queue=self.name).inc()
+        self.task_done()
+
+
+class MarketPipeline:
+    """fetch -> normalize -> merge -> publish 스테이지를 bounded 큐로 연결한 시세 파이프라인
+
+    - fetch: Ticker.info 수집 (공유 캐시 적중 시 정규화 단계를 건너뜀)
+    - normalize: 발행 포맷 변환 + 공유 캐시 저장
+    - merge: 이번 사이클의 그룹 결과에 병합 + 인트라데이 봉 반영
+    - publish: 심볼이 모두 끝난 그룹을 Redis 로 한 번 발행 (스냅샷 MULTI)
+    publish 는 별도 태스크라 Redis 쓰기 중에도 다음 그룹 수집이 계속된다.
+    이번 사이클에 틱을 내지 못한 심볼은 발행에서 빠진다.
+    """
+
+    def __init__(self, service: StockService, name: str = "publish_market_data"):
+        self.service = service
+        self.name = name
+        self.fetch_queue: asyncio.Queue = asyncio.Queue(PipelineConstants.FETCH_QUEUE_SIZE)
+        self.normalize_queue = LatestQuoteQueue('normalize', PipelineConstants.NORMALIZE_QUEUE_SIZE)
+        self.merge_queue = LatestQuoteQueue('merge', PipelineConstants.MERGE_QUEUE_SIZE)
+        self.publish_queue: asyncio.Queue = asyncio.Queue(PipelineConstants.PUBLISH_QUEUE_SIZE)
+        self.pending: Dict[str, Set[str]] = {}  # 그룹 -> 아직 끝나지 않은 심볼
+        self.results: Dict[str, Dict[str, Any]] = {}  # 그룹 -> 이번 사이클 시세
+        self.tasks: List[asyncio.Task] = []
+        QUEUE_DEPTH.labels(queue='fetch').set_function(self.fetch_queue.qsize)
+        QUEUE_DEPTH.labels(queue='publish').set_function(self.publish_queue.qsize)
+
+    def start(self) -> None:
+        stages = [('fetch', self.fetch_stage, PipelineConstants.FETCH_CONCURRENCY),
+                  ('normalize', self.normalize_stage, PipelineConstants.NORMALIZE_CONCURRENCY),
+                  ('merge', self.merge_stage, 1),
+                  ('publish', self.publish_stage, 1)]
+        for stage, handler, concurrency in stages:
+            for index in range(concurrency):
+                self.tasks.append(asyncio.create_task(
+                    handler(), name=f"{self.name}.{stage}-{index}"))
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks.clear()
+
+    async def run_cycle(self, groups: List[Tuple[List[str], str]]) -> None:
+        """모든 그룹의 심볼을 차례로 넣고, 끝난 그룹부터 publish 스테이지로 넘긴다"""
+        active = []
+        for symbols, group_type in groups:
+            if not self.service.should_fetch(group_type):
+                logger.debug(f"{group_type} market closed, skipping collection")
+                continue
+            if symbols:
+                self.pending[group_type] = set(symbols)
+                self.results[group_type] = {}
+                active.append((symbols, group_type))
+
+        for symbols, group_type in active:
+            for symbol in symbols:
+                await self.fetch_queue.put((symbol, group_type))
+
+        await self.fetch_queue.join()
+        await self.normalize_queue.join()
+        await self.merge_queue.join()
+        # 모든 경로가 finish 를 호출하지만 남은 그룹이 있으면 여기서 마무리
+        for group_type in list(self.pending):
+            await self.complete(group_type)
+        await self.publish_queue.join()
+
+    async def finish(self, symbol: str, group_type: str) -> None:
+        """심볼 처리 종료 (성공/실패 무관). 그룹의 마지막 심볼이면 발행 대기열로"""
+        pending = self.pending.get(group_type)
+        if pending is None:
+            return
+        pending.discard(symbol)
+        if not pending:
+            await self.complete(group_type)
+
+    async def complete(self, group_type: str) -> None:
+        self.pending.pop(group_type, None)
+        result = self.results.pop(group_type, None)
+        if result:
+            # 큐가 가득 차면(Redis 지연) 여기서 대기해 수집 속도를 늦춘다
+            await self.publish_queue.put((group_type, result))
+
+    async def publish_stage(self) -> None:
+        while True:
+            group_type, result = await self.publish_queue.get()
+            start_time = time.perf_counter()
+            try:
+                await asyncio.to_thread(
+                    self.service.snapshot_writer.publish,
+                    self.service.channels[group_type.lower()],
+                    group_type.lower(),
+                    result
+                )
+                STAGE_ITEMS.labels(stage='publish').inc()
+            except Exception as e:
+                STAGE_ERRORS.labels(stage='publish').inc()
+                logger.error(f"Error publishing {group_type} data: {str(e)}")
+            finally:
+                STAGE_SECONDS.labels(stage='publish').observe(time.perf_counter() - start_time)
+                self.publish_queue.task_done()
+
+    async def fetch_stage(self) -> None:
+        while True:
+            symbol, group_type = await self.fetch_queue.get()
+            start_time = time.perf_counter()
+            key = f"tick.{symbol}"
+            try:
+                cached, should_fetch = await self.service.cache.lookup(key)
+                if not should_fetch:
+                    await self.hand_off(self.merge_queue, symbol, group_type, cached)
+                else:
+                    pooled = self.service.acquire_session()
+                    try:
+                        _, info = await self.service.fetch_single_ticker(symbol, pooled)
+                    except Exception:
+                        self.service.cache.abandon(key)
+                        raise
+                    await self.hand_off(self.normalize_queue, symbol, group_type, info)
+                STAGE_ITEMS.labels(stage='fetch').inc()
+            except Exception as e:
+                STAGE_ERRORS.labels(stage='fetch').inc()
+                logger.error(f"Failed to process {symbol}: {str(e)}")
+                await self.finish(symbol, group_type)
+            finally:
+                STAGE_SECONDS.labels(stage='fetch').observe(time.perf_counter() - start_time)
+                self.fetch_queue.task_done()
+
+    async def normalize_stage(self) -> None:
+        while True:
+            symbol, group_type, info = await self.normalize_queue.get()
+            start_time = time.perf_counter()
+            try:
+                tick = self.service.quote_tick(group_type, info)
+                if tick:
+                    self.service.cache.store(f"tick.{symbol}", tick, CacheConstants.QUOTE_TTL)
+                    await self.hand_off(self.merge_queue, symbol, group_type, tick)
+                else:
+                    await self.finish(symbol, group_type)
+                STAGE_ITEMS.labels(stage='normalize').inc()
+            except Exception as e:
+                STAGE_ERRORS.labels(stage='normalize').inc()
+                logger.error(f"Failed to normalize {symbol}: {str(e)}")
+                await self.finish(symbol, group_type)
+            finally:
+                STAGE_SECONDS.labels(stage='normalize').observe(time.perf_counter() - start_time)
+                self.normalize_queue.task_done()
+
+    async def hand_off(self, queue: LatestQuoteQueue, symbol: str, group_type: str, value: Any) -> None:
+        evicted = queue.put_nowait(f"{group_type}.{symbol}", (symbol, group_type, value))
+        if evicted is not None:
+            await self.finish(evicted[0], evicted[1])
+
+    async def merge_stage(self) -> None:
+        while True:
+            symbol, group_type, tick = await self.merge_queue.get()
+            try:
+                result = self.results.get(group_type)
+                if result is not None:
+                    result[symbol] = tick["quote"]
+                self.service.candles.add_tick(
+                    symbol, self.service.quote_price(tick["quote"]), tick["market_time"])
+                STAGE_ITEMS.labels(stage='merge').inc()
+            except Exception as e:
+                STAGE_ERRORS.labels(stage='merge').inc()
+                logger.error(f"Failed to merge {symbol}: {str(e)}")
+            finally:
+                await self.finish(symbol, group_type)
+                self.merge_queue.task_done()
@@ -2,9 +2,12 @@ import asyncio
 import logging
 import time
 from ..services.stock_service import StockService
+from ..services.candle_aggregator import CandleAggregator
+from ..core.worker_status import WorkerStatus
+from .market_pipeline import MarketPipeline
 from typing import Dict, Any
-from ..constants.app_constants import TimeConstants
-from ..models.stock_models import INDICES, STOCKS, CRYPTO
+from ..constants.app_constants import TimeConstants, CandleConstants
+from ..models.stock_models import INDICES, STOCKS, CRYPTO, AssetType
 
 # 로깅 설정
 logging.basicConfig(
@@ -14,42 +17,85 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def publish_market_data():
-    service = StockService()
+QUOTE_GROUPS = [
+    (INDICES, AssetType.INDEX.value),
+    (STOCKS, AssetType.STOCK.value),
+    (CRYPTO, AssetType.CRYPTO.value),
+]
 
-    while True:
-        try:
-            start_time = time.time()
-            logger.info(
-                "Starting ALL MARKET (INDEX/STOCK/CRYPTO/FOREX) data collection...")
 
-            await service.get_current_market_data()
+async def publish_market_data():
+    service = StockService()
+    worker_status = WorkerStatus()
+    pipeline = MarketPipeline(service)
+    pipeline.start()
 
-            elapsed_time = time.time() - start_time
-            logger.info(
-                f"ALL MARKET data published. Took {elapsed_time:.2f} seconds")
-        except Exception as e:
-            logger.error(f"Market data publishing error: {str(e)}")
-            await asyncio.sleep(TimeConstants.DEFAULT_RETRY_DELAY)
+    try:
+        while True:
+            try:
+                start_time = time.time()
+                logger.info(
+                    "Starting ALL MARKET (INDEX/STOCK/CRYPTO) data collection...")
+
+                # FOREX 는 publish_forex_data 에서만 수집
+                with worker_status.cycle("publish_market_data"):
+                    await pipeline.run_cycle(QUOTE_GROUPS)
+
+                elapsed_time = time.time() - start_time
+                logger.info(
+                    f"ALL MARKET data published. Took {elapsed_time:.2f} seconds")
+
+                # 공유 캐시 적중 시 사이클이 짧아지므로 최소 주기를 유지
+                if not service.capture.replaying and elapsed_time < TimeConstants.MARKET_CYCLE_MIN_INTERVAL:
+                    await worker_status.idle(
+                        "publish_market_data", TimeConstants.MARKET_CYCLE_MIN_INTERVAL - elapsed_time)
+            except Exception as e:
+                logger.error(f"Market data publishing error: {str(e)}")
+                await worker_status.idle("publish_market_data", TimeConstants.DEFAULT_RETRY_DELAY)
+    finally:
+        await pipeline.stop()
 
 
 async def publish_forex_data():
     service = StockService()
+    worker_status = WorkerStatus()
 
     while True:
         try:
             start_time = time.time()
             logger.info("Starting forex data collection...")
 
-            await service.process_forex()
+            with worker_status.cycle("publish_forex_data"):
+                await service.process_forex()
 
             elapsed_time = time.time() - start_time
             logger.info(
                 f"Forex data published. Took {elapsed_time:.2f} seconds")
-            await asyncio.sleep(TimeConstants.DEFAULT_UPDATE_INTERVAL)
+            await worker_status.idle("publish_forex_data", TimeConstants.DEFAULT_UPDATE_INTERVAL)
         except Exception as e:
             logger.error(f"Forex data publishing error: {str(e)}")
-            await asyncio.sleep(TimeConstants.DEFAULT_RETRY_DELAY)
+            await worker_status.idle("publish_forex_data", TimeConstants.DEFAULT_RETRY_DELAY)
+
+
+async def flush_candles():
+    """봉 경계마다 마감된 인트라데이 봉 저장 (마지막 봉도 다음 틱을 기다리지 않음)"""
+    aggregator = CandleAggregator()
+    worker_status = WorkerStatus()
+    boundary = min(CandleConstants.INTERVALS.values())
+
+    while True:
+        try:
+            with worker_status.cycle("flush_candles"):
+                flushed = await asyncio.to_thread(aggregator.flush_due)
+            if flushed:
+                logger.debug(f"Flushed {flushed} candle series")
+        except Exception as e:
+            logger.error(f"Candle flush error: {str(e)}")
+
+        # 다음 봉 경계 + 늦은 틱 유예
+        now = time.time()
+        next_flush = ((now - CandleConstants.FLUSH_DELAY) // boundary + 1) * boundary
+        await worker_status.idle("flush_candles", next_flush + CandleConstants.FLUSH_DELAY - now)
 
 
 async def main():
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Coroutine, Dict, Optional
+
+from ..core.redis_manager import RedisManager
+from ..core.worker_status import WorkerStatus
+from ..constants.app_constants import SupervisorConstants
+
+logger = logging.getLogger(__name__)
+
+
+class SupervisedWorker:
+    def __init__(self, name: str, factory: Callable[[], Coroutine], deadline: int):
+        self.name = name
+        self.factory = factory
+        self.deadline = deadline
+        self.task: Optional[asyncio.Task] = None
+        self.restart_task: Optional[asyncio.Task] = None
+        self.started_at: Optional[float] = None
+        self.restarts = 0
+        self.consecutive_restarts = 0
+        self.last_restart_reason: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        if self.restart_task is not None:
+            return "restarting"
+        if self.task is None:
+            return "pending"
+        if self.task.done():
+            return "stopped"
+        return "running"
+
+
+class WorkerSupervisor:
+    """워커 태스크를 소유하고 죽거나 사이클 제한 시간을 넘기면 재시작"""
+
+    def __init__(self):
+        self.workers: Dict[str, SupervisedWorker] = {}
+        self.worker_status = WorkerStatus()
+        self._watch_task: Optional[asyncio.Task] = None
+
+    def add(self, name: str, factory: Callable[[], Coroutine], deadline: Optional[int] = None):
+        self.worker_status.register(name)
+        self.workers[name] = SupervisedWorker(
+            name, factory,
+            deadline or SupervisorConstants.CYCLE_DEADLINES.get(
+                name, SupervisorConstants.DEFAULT_DEADLINE)
+        )
+
+    async def start(self, stagger: float = 0):
+        for index, worker in enumerate(self.workers.values()):
+            if index and stagger:
+                await asyncio.sleep(stagger)
+            self._spawn(worker)
+        if self._watch_task is None:
+            self._watch_task = asyncio.create_task(self.watch(), name="supervisor")
+
+    async def stop(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+        for worker in self.workers.values():
+            for task in (worker.restart_task, worker.task):
+                if task and not task.done():
+                    task.cancel()
+
+    def _spawn(self, worker: SupervisedWorker):
+        worker.task = asyncio.create_task(worker.factory(), name=worker.name)
+        worker.started_at = time.time()
+        logger.info(f"Worker {worker.name} started")
+
+    async def watch(self):
+        while True:
+            try:
+                self.check()
+                self.publish_heartbeats()
+            except Exception as e:
+                logger.error(f"Supervisor check error: {str(e)}")
+            await asyncio.sleep(SupervisorConstants.CHECK_INTERVAL)
+
+    def check(self):
+        now = time.time()
+        for worker in self.workers.values():
+            if worker.restart_task is not None or worker.task is None:
+                continue
+
+            state = self.worker_status.get(worker.name)
+
+            # 재시작 이후 사이클을 성공하면 백오프 초기화
+            if state.last_success_at and state.last_success_at > worker.started_at:
+                worker.consecutive_restarts = 0
+
+            if worker.task.done():
+                error = None if worker.task.cancelled() else worker.task.exception()
+                self.schedule_restart(worker, f"exited: {error!r}")
+            elif state.cycle_started_at and now - state.cycle_started_at > worker.deadline:
+                self.schedule_restart(
+                    worker, f"cycle exceeded {worker.deadline}s deadline")
+
+    def schedule_restart(self, worker: SupervisedWorker, reason: str):
+        worker.last_restart_reason = reason
+        worker.restart_task = asyncio.create_task(
+            self._restart(worker), name=f"{worker.name}.restart")
+
+    async def _restart(self, worker: SupervisedWorker):
+        delay = min(
+            SupervisorConstants.BACKOFF_BASE * (2 ** worker.consecutive_restarts),
+            SupervisorConstants.BACKOFF_MAX
+        )
+        logger.warning(
+            f"Restarting worker {worker.name} in {delay}s ({worker.last_restart_reason})")
+        try:
+            if not worker.task.done():
+                worker.task.cancel()
+                await asyncio.wait({worker.task}, timeout=SupervisorConstants.CANCEL_TIMEOUT)
+            await asyncio.sleep(delay)
+            worker.restarts += 1
+            worker.consecutive_restarts += 1
+            self._spawn(worker)
+        finally:
+            worker.restart_task = None
+
+    def publish_heartbeats(self):
+        redis_client = RedisManager().client
+        pipe = redis_client.pipeline(transaction=False)
+        for name, status in self.status().items():
+            key = f"worker.{name}"
+            pipe.hset(key, mapping={
+                field: "" if value is None else str(value)
+                for field, value in status.items()
+            })
+            pipe.expire(key, SupervisorConstants.HEARTBEAT_TTL)
+        pipe.execute()
+
+    def status(self) -> Dict[str, dict]:
+        result = {}
+        for name, worker in self.workers.items():
+            state = self.worker_status.get(name)
+            stalled = (state.cycle_started_at is not None
+                       and time.time() - state.cycle_started_at > worker.deadline)
+            result[name] = {
+                "state": "stalled" if stalled else worker.state,
+                "deadline": worker.deadline,
+                "restarts": worker.restarts,
+                "last_restart_reason": worker.last_restart_reason,
+                "cycles": state.cycles,
+                "errors": state.errors,
+                "last_heartbeat": state.last_heartbeat,
+                "last_duration": state.last_duration,
+                "last_success_at": state.last_success_at
+            }
+        return result
+
+    @property
+    def healthy(self) -> bool:
+        return all(status["state"] == "running" for status in self.status().values())
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from app.services.technical_indicators import IndicatorEngine
+
+DATES = [f"2024-{month:02d}-{day:02d}" for month in (1, 2, 3) for day in range(1, 29)]
+
+
+def make_chart(closes, start, end):
+    return {day: {"close": str(close)} for day, close in zip(DATES[start:end], closes[start:end])}
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return 100 + np.cumsum(rng.normal(0, 1, len(DATES)))
+
+
+@pytest.mark.parametrize("slide", [0, 1])
+def test_incremental_matches_full(closes, slide):
+    """증분 갱신 결과가 실행 이력과 무관하게 전체 계산과 같아야 한다 (slide=1: 30봉 구간 이동)"""
+    engine = IndicatorEngine()
+    previous = engine.compute("AAPL", "STOCK", make_chart(closes, 0, 30), "t0")
+
+    for step in range(1, 20):
+        chart = make_chart(closes, step * slide, 30 + step)
+        incremental = engine.compute("AAPL", "STOCK", chart, "t1", previous)
+        full = engine.compute("AAPL", "STOCK", chart, "t1")
+        assert incremental["series"] == full["series"]
+        assert incremental["values"] == full["values"]
+        previous = incremental
+
+
+def test_unchanged_chart_returns_none(closes):
+    engine = IndicatorEngine()
+    chart = make_chart(closes, 0, 30)
+    previous = engine.compute("AAPL", "STOCK", chart, "t0")
+    assert engine.compute("AAPL", "STOCK", chart, "t1", previous) is None
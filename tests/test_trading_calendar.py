@@ -0,0 +1,65 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.utils.trading_calendar import (
+    ET, FOREX_CALENDAR, NYSE_CALENDAR, TradingCalendar, nyse_early_closes, nyse_holidays
+)
+
+
+@pytest.mark.parametrize("day", [
+    date(2021, 7, 5),    # 독립기념일 (일요일) -> 월요일 휴장
+    date(2021, 12, 24),  # 크리스마스 (토요일) -> 금요일 휴장
+    date(2022, 6, 20),   # Juneteenth (일요일) -> 월요일 휴장
+    date(2022, 12, 26),  # 크리스마스 (일요일) -> 월요일 휴장
+    date(2023, 1, 2),    # 새해 (일요일) -> 월요일 휴장
+    date(2024, 3, 29),   # Good Friday
+    date(2026, 7, 3),    # 독립기념일 (토요일) -> 금요일 휴장
+    date(2027, 6, 18),   # Juneteenth (토요일) -> 금요일 휴장
+])
+def test_observed_holidays(day):
+    assert day in nyse_holidays(day.year)
+    assert not NYSE_CALENDAR.is_session(day)
+
+
+@pytest.mark.parametrize("day", [
+    date(2021, 6, 18),   # Juneteenth 지정 전
+    date(2021, 12, 31),  # 새해가 토요일이면 전년도 12/31 은 정상 개장
+    date(2027, 12, 31),
+])
+def test_sessions_not_shifted(day):
+    assert NYSE_CALENDAR.is_session(day)
+
+
+@pytest.mark.parametrize("year, expected", [
+    (2021, {date(2021, 11, 26)}),                                         # 12/24 는 휴장
+    (2022, {date(2022, 11, 25)}),                                         # 7/3, 12/24 주말
+    (2023, {date(2023, 7, 3), date(2023, 11, 24)}),
+    (2024, {date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)}),
+    (2026, {date(2026, 11, 27), date(2026, 12, 24)}),                     # 7/3 은 휴장
+])
+def test_early_closes(year, expected):
+    assert nyse_early_closes(year) == expected
+
+
+def test_early_close_shortens_trading_window():
+    regular = NYSE_CALENDAR.regular_hours(date(2024, 12, 24))
+    window = NYSE_CALENDAR.trading_window(date(2024, 12, 24))
+    assert regular[1] == ET.localize(datetime(2024, 12, 24, 13, 0))
+    assert window[1] == ET.localize(datetime(2024, 12, 24, 17, 0))
+
+
+def test_session_navigation_skips_holidays():
+    assert NYSE_CALENDAR.next_session(date(2022, 12, 23)) == date(2022, 12, 27)
+    assert NYSE_CALENDAR.previous_session(date(2023, 1, 3)) == date(2022, 12, 30)
+
+
+def test_forex_week_opens_sunday_evening():
+    assert not FOREX_CALENDAR.is_trading_window(ET.localize(datetime(2024, 6, 9, 16, 59)))
+    assert FOREX_CALENDAR.is_trading_window(ET.localize(datetime(2024, 6, 9, 17, 0)))
+    assert not FOREX_CALENDAR.is_trading_window(ET.localize(datetime(2024, 6, 14, 17, 0)))
+
+
+def test_base_calendar_is_abstract():
+    with pytest.raises(TypeError):
+        TradingCalendar()
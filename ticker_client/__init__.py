@@ -0,0 +1,10 @@
+from .client import TickerClient, Update, GROUP_CHANNELS
+from .views import (
+    QuoteView, IndexView, StockView, CryptoView, ForexView, IndicatorView, view_for
+)
+
+__all__ = [
+    "TickerClient", "Update", "GROUP_CHANNELS",
+    "QuoteView", "IndexView", "StockView", "CryptoView", "ForexView", "IndicatorView",
+    "view_for",
+]
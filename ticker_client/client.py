@@ -0,0 +1,208 @@
+import asyncio
+import inspect
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+
+from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError, TimeoutError
+
+from .views import QuoteView, view_for
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 그룹 -> 발행 채널
+GROUP_CHANNELS: Dict[str, str] = {
+    'index': 'index.price.stream',
+    'fear-greed': 'index.price.stream',
+    'stock': 'stock.price.stream',
+    'crypto': 'crypto.price.stream',
+    'btc-dominance': 'crypto.price.stream',
+    'total3': 'crypto.price.stream',
+    'forex': 'forex.price.stream',
+}
+HASH_PREFIX = 'snapshot.hash'
+SUBSCRIBE_TIMEOUT = 5.0
+RECONNECT_DELAY = 1.0
+RECONNECT_DELAY_MAX = 30.0
+
+
+class Update:
+    """한 심볼의 변경 알림 (previous 는 직전 뷰, 첫 값이면 None)"""
+    __slots__ = ('symbol', 'channel', 'view', 'previous')
+
+    def __init__(self, symbol: str, channel: Optional[str], view: QuoteView,
+                 previous: Optional[QuoteView]):
+        self.symbol = symbol
+        self.channel = channel
+        self.view = view
+        self.previous = previous
+
+    def __repr__(self) -> str:
+        return f"Update({self.symbol!r}, {self.view.data!r})"
+
+
+class TickerClient:
+    """스냅샷 + 가격 스트림 구독 클라이언트
+
+    구독을 먼저 확정한 뒤 스냅샷을 읽는다. 발행과 스냅샷 저장은 한 MULTI 로
+    처리되므로 그 사이 도착한 메시지는 이미 스냅샷에 포함되어 있어 버린다.
+    이후 메시지는 심볼별로 비교해 바뀐 심볼만 알린다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None,
+                 groups: Iterable[str] = tuple(GROUP_CHANNELS),
+                 queue_size: int = 1024, **redis_kwargs: Any):
+        # 호출자가 넘긴 클라이언트는 호출자가 닫는다
+        self._owns_client = redis_client is None
+        self.redis = redis_client or aioredis.Redis(decode_responses=True, **redis_kwargs)
+        self.groups = list(groups)
+        self.channels = sorted({GROUP_CHANNELS[group] for group in self.groups})
+        self.queue_size = queue_size
+        self.cache: Dict[str, QuoteView] = {}
+        self.ready = asyncio.Event()
+        self._callbacks: List[Callable[[Update], Any]] = []
+        self._queues: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'TickerClient':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """백그라운드 구독을 시작하고 첫 스냅샷 적용까지 대기"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="ticker_client")
+        ready = asyncio.create_task(self.ready.wait())
+        await asyncio.wait({ready, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if not ready.done():
+            ready.cancel()
+            self._task.result()  # 시작 중 실패한 예외를 그대로 전달
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._owns_client:
+            await self.redis.close()
+
+    # 조회 API
+    def get(self, symbol: str) -> Optional[QuoteView]:
+        return self.cache.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.cache
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.cache)
+
+    # 알림 API
+    def on_update(self, callback: Callable[[Update], Any]) -> Callable[[Update], Any]:
+        """콜백 등록 (동기/비동기 함수 모두 가능, 데코레이터로도 사용)"""
+        self._callbacks.append(callback)
+        return callback
+
+    async def updates(self) -> AsyncIterator[Update]:
+        """변경된 심볼을 순서대로 내보내는 async iterator (느린 소비자는 오래된 것부터 버림)"""
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._queues.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.discard(queue)
+
+    # 내부 구현
+    async def run(self) -> None:
+        delay = RECONNECT_DELAY
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await self.bootstrap(pubsub)
+                    delay = RECONNECT_DELAY
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self.apply_message(message)
+            except (ConnectionError, TimeoutError, OSError) as e:
+                self.ready.clear()
+                logger.warning(f"Ticker stream disconnected ({str(e)}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+    async def bootstrap(self, pubsub) -> None:
+        """SUBSCRIBE 확인 -> 스냅샷 적용 (확인 전에 받은 메시지는 스냅샷에 포함되어 버림)"""
+        await pubsub.subscribe(*self.channels)
+        confirmed, skipped = 0, 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SUBSCRIBE_TIMEOUT
+        while confirmed < len(self.channels):
+            if loop.time() > deadline:
+                raise TimeoutError("Timed out waiting for subscription")
+            message = await pubsub.get_message(timeout=SUBSCRIBE_TIMEOUT)
+            if message is None:
+                continue
+            if message["type"] == "subscribe":
+                confirmed += 1
+            elif message["type"] == "message":
+                # 스냅샷 조회 전에 발행된 메시지이므로 스냅샷보다 오래되었거나 같다
+                skipped += 1
+
+        for group, result in zip(self.groups, await self.read_snapshots()):
+            await self.merge(GROUP_CHANNELS[group], result)
+        self.ready.set()
+        logger.info(f"Ticker snapshot loaded ({len(self.cache)} symbols, {skipped} superseded)")
+
+    async def read_snapshots(self) -> List[Dict[str, Any]]:
+        """그룹별 스냅샷 (필드별 해시 우선, 없으면 기존 snapshot.{group} JSON)"""
+        pipe = self.redis.pipeline(transaction=False)
+        for group in self.groups:
+            pipe.hgetall(f"{HASH_PREFIX}.{group}")
+            pipe.get(f"snapshot.{group}")
+        replies = await pipe.execute()
+
+        snapshots = []
+        for fields, blob in zip(replies[::2], replies[1::2]):
+            if fields:
+                snapshots.append({symbol: json.loads(value) for symbol, value in fields.items()})
+            else:
+                snapshots.append(json.loads(blob) if blob else {})
+        return snapshots
+
+    async def apply_message(self, message: Dict[str, Any]) -> None:
+        try:
+            result = json.loads(message["data"])
+        except (TypeError, ValueError) as e:
+            logger.error(f"Invalid message on {message.get('channel')}: {str(e)}")
+            return
+        await self.merge(message.get("channel"), result)
+
+    async def merge(self, channel: Optional[str], result: Dict[str, Any]) -> None:
+        """바뀐 심볼만 캐시에 반영하고 알림"""
+        for symbol, data in result.items():
+            if not isinstance(data, dict):
+                continue
+            previous = self.cache.get(symbol)
+            if previous is not None and previous.data == data:
+                continue
+            view = view_for(symbol, data)
+            self.cache[symbol] = view
+            await self.notify(Update(symbol, channel, view, previous))
+
+    async def notify(self, update: Update) -> None:
+        for callback in self._callbacks:
+            try:
+                result = callback(update)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Update callback failed for {update.symbol}: {str(e)}")
+
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Optional
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """발행 포맷의 숫자 문자열 ("1234.56") -> float"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def number_field(name: str) -> property:
+    """data[name] 을 접근할 때만 float 로 변환하는 프로퍼티"""
+    def getter(self: 'QuoteView') -> Optional[float]:
+        return parse_number(self.data.get(name))
+    getter.__name__ = name
+    return property(getter)
+
+
+def text_field(name: str) -> property:
+    def getter(self: 'QuoteView') -> Optional[str]:
+        return self.data.get(name)
+    getter.__name__ = name
+    return property(getter)
+
+
+class QuoteView:
+    """발행된 심볼 dict 를 복사하지 않고 감싸는 타입 뷰"""
+    __slots__ = ('symbol', 'data')
+    price_field = 'current_price'
+
+    def __init__(self, symbol: str, data: Dict[str, Any]):
+        self.symbol = symbol
+        self.data = data
+
+    @property
+    def price(self) -> Optional[float]:
+        return parse_number(self.data.get(self.price_field))
+
+    change = number_field('change')
+    change_percent = number_field('change_percent')
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.symbol!r}, {self.data!r})"
+
+
+class IndexView(QuoteView):
+    """IndexData"""
+    __slots__ = ()
+    price_field = 'current_value'
+    current_value = number_field('current_value')
+
+
+class StockView(QuoteView):
+    """StockData"""
+    __slots__ = ()
+    current_price = number_field('current_price')
+    market_cap = text_field('market_cap')
+    market_state = text_field('market_state')
+    otc_price = number_field('otc_price')
+    otc_change = number_field('otc_change')
+    otc_change_percent = number_field('otc_change_percent')
+
+
+class CryptoView(QuoteView):
+    """CryptoData"""
+    __slots__ = ()
+    current_price = number_field('current_price')
+    market_cap = text_field('market_cap')
+
+
+class ForexView(QuoteView):
+    """ForexData"""
+    __slots__ = ()
+    price_field = 'rate'
+    rate = number_field('rate')
+
+
+class IndicatorView(QuoteView):
+    """Fear & Greed, BTC 도미넌스, TOTAL3 등 시장 지표"""
+    __slots__ = ()
+    price_field = 'value'
+    value = number_field('value')
+    score = number_field('score')
+    rating = text_field('rating')
+    market_cap = text_field('market_cap')
+
+
+def view_for(symbol: str, data: Dict[str, Any]) -> QuoteView:
+    """필드 구성으로 발행 포맷을 판별"""
+    if 'rate' in data:
+        return ForexView(symbol, data)
+    if 'market_state' in data:
+        return StockView(symbol, data)
+    if 'current_value' in data:
+        return IndexView(symbol, data)
+    if 'current_price' in data:
+        return CryptoView(symbol, data)
+    return IndicatorView(symbol, data)